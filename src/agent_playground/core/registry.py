@@ -1,10 +1,24 @@
 """Agent registry for managing and creating agent instances."""
 
-from typing import Dict, Type, Optional, Any, List
+import sys
+from typing import Dict, Type, Optional, Any, List, NamedTuple
 from .base import BaseAgent, AgentConfig, AgentState
 from ..utils.logging import LoggingMixin
 
 
+class _Entry(NamedTuple):
+    """Registration record for a single agent.
+    
+    Facts known at registration time (class and module names) are resolved
+    once here so lookups never touch the agent class again.
+    """
+    agent_class: Type[BaseAgent]
+    config: AgentConfig
+    class_name: str
+    module_name: str
+    singleton: bool = False
+
+
 class AgentRegistry(LoggingMixin):
     """
     Registry for managing reusable agents.
@@ -18,8 +32,7 @@ class AgentRegistry(LoggingMixin):
     
     def __init__(self):
         """Initialize the agent registry."""
-        self._agents: Dict[str, Type[BaseAgent]] = {}
-        self._configs: Dict[str, AgentConfig] = {}
+        self._entries: Dict[str, _Entry] = {}
         self._instances: Dict[str, BaseAgent] = {}
         
         self.log_info("Agent registry initialized")
@@ -40,31 +53,46 @@ class AgentRegistry(LoggingMixin):
             config: Default configuration for the agent
             singleton: If True, only one instance will be created and reused
         """
-        if name in self._agents:
+        if name in self._entries:
             self.log_warning(f"Overriding existing agent registration: {name}")
         
-        self._agents[name] = agent_class
-        self._configs[name] = config
+        # Deprecated: singleton used to be smuggled through config.metadata
+        metadata = getattr(config, "metadata", None)
+        if isinstance(metadata, dict) and "singleton" in metadata:
+            self.log_warning(
+                "config.metadata['singleton'] is deprecated; pass singleton= to register()",
+                agent=name
+            )
+            singleton = singleton or bool(metadata["singleton"])
         
-        # Store singleton flag in config metadata
-        if hasattr(config, 'metadata'):
-            config.metadata = config.metadata or {}
-        else:
-            config.metadata = {}
-        config.metadata['singleton'] = singleton
+        entry = _Entry(
+            agent_class=agent_class,
+            config=config,
+            class_name=sys.intern(agent_class.__name__),
+            module_name=sys.intern(agent_class.__module__),
+            singleton=singleton,
+        )
+        self._entries[name] = entry
         
         self.log_info(
             f"Registered agent: {name}", 
-            agent_class=agent_class.__name__,
+            agent_class=entry.class_name,
             singleton=singleton
         )
     
-    def create(self, name: str, **config_overrides: Any) -> BaseAgent:
+    def create(
+        self,
+        name: str,
+        *,
+        use_cache: bool = False,
+        **config_overrides: Any
+    ) -> BaseAgent:
         """
         Create an agent instance with optional config overrides.
         
         Args:
             name: Name of the registered agent
+            use_cache: If True, return any cached instance instead of creating one
             **config_overrides: Configuration overrides
             
         Returns:
@@ -73,17 +101,21 @@ class AgentRegistry(LoggingMixin):
         Raises:
             ValueError: If agent is not registered
         """
-        if name not in self._agents:
-            available = list(self._agents.keys())
+        entry = self._entries.get(name)
+        if entry is None:
+            available = list(self._entries.keys())
             raise ValueError(f"Agent '{name}' not registered. Available: {available}")
         
-        base_config = self._configs[name]
-        is_singleton = base_config.metadata.get('singleton', False)
+        base_config = entry.config
+        is_singleton = entry.singleton
         
-        # Return existing instance if singleton
-        if is_singleton and name in self._instances:
-            self.log_debug(f"Returning existing singleton instance: {name}")
-            return self._instances[name]
+        # Return existing instance if singleton (or caller accepts a cached one)
+        if is_singleton or use_cache:
+            cached = self._instances.get(name)
+            if cached is not None:
+                if self.is_enabled_for("DEBUG"):
+                    self.log_debug(f"Returning existing singleton instance: {name}")
+                return cached
         
         # Create new configuration with overrides
         config_dict = base_config.model_dump()
@@ -91,18 +123,18 @@ class AgentRegistry(LoggingMixin):
         new_config = AgentConfig(**config_dict)
         
         # Create new instance
-        agent_class = self._agents[name]
-        instance = agent_class(new_config)
+        instance = entry.agent_class(new_config)
         
         # Store singleton instance
         if is_singleton:
             self._instances[name] = instance
         
-        self.log_info(
-            f"Created agent instance: {name}",
-            agent_class=agent_class.__name__,
-            overrides=list(config_overrides.keys()) if config_overrides else None
-        )
+        if self.is_enabled_for("INFO"):
+            self.log_info(
+                f"Created agent instance: {name}",
+                agent_class=entry.class_name,
+                overrides=list(config_overrides) if config_overrides else None
+            )
         
         return instance
     
@@ -117,10 +149,7 @@ class AgentRegistry(LoggingMixin):
         Returns:
             Agent instance
         """
-        if name in self._instances:
-            return self._instances[name]
-        
-        return self.create(name, **config_overrides)
+        return self.create(name, use_cache=True, **config_overrides)
     
     def list_agents(self) -> List[str]:
         """
@@ -129,7 +158,7 @@ class AgentRegistry(LoggingMixin):
         Returns:
             List of agent names
         """
-        return list(self._agents.keys())
+        return list(self._entries.keys())
     
     def get_config(self, name: str) -> Optional[AgentConfig]:
         """
@@ -141,7 +170,8 @@ class AgentRegistry(LoggingMixin):
         Returns:
             Agent configuration or None if not found
         """
-        return self._configs.get(name)
+        entry = self._entries.get(name)
+        return entry.config if entry else None
     
     def get_agent_class(self, name: str) -> Optional[Type[BaseAgent]]:
         """
@@ -153,7 +183,8 @@ class AgentRegistry(LoggingMixin):
         Returns:
             Agent class or None if not found
         """
-        return self._agents.get(name)
+        entry = self._entries.get(name)
+        return entry.agent_class if entry else None
     
     def unregister(self, name: str) -> bool:
         """
@@ -165,12 +196,11 @@ class AgentRegistry(LoggingMixin):
         Returns:
             True if agent was unregistered, False if not found
         """
-        if name not in self._agents:
+        if name not in self._entries:
             return False
         
         # Clean up
-        del self._agents[name]
-        del self._configs[name]
+        del self._entries[name]
         if name in self._instances:
             del self._instances[name]
         
@@ -179,9 +209,8 @@ class AgentRegistry(LoggingMixin):
     
     def clear(self) -> None:
         """Clear all registered agents."""
-        agent_count = len(self._agents)
-        self._agents.clear()
-        self._configs.clear()
+        agent_count = len(self._entries)
+        self._entries.clear()
         self._instances.clear()
         
         self.log_info(f"Cleared {agent_count} registered agents")
@@ -194,19 +223,16 @@ class AgentRegistry(LoggingMixin):
             Dictionary with registry information
         """
         return {
-            "total_registered": len(self._agents),
+            "total_registered": len(self._entries),
             "total_instances": len(self._instances),
             "agents": {
                 name: {
-                    "class": agent_class.__name__,
-                    "module": agent_class.__module__,
-                    "config": config.model_dump(),
+                    "class": entry.class_name,
+                    "module": entry.module_name,
+                    "config": entry.config.model_dump(),
                     "has_instance": name in self._instances,
                 }
-                for name, (agent_class, config) in zip(
-                    self._agents.keys(),
-                    zip(self._agents.values(), self._configs.values())
-                )
+                for name, entry in self._entries.items()
             }
         }
     
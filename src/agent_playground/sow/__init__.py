@@ -1,11 +1,24 @@
 """Source of Wealth (SOW) analysis agents and workflows."""
 
-from .agents import *
+import importlib
+from typing import Any
+
 from .state import SOWState, VerificationResult
-from .workflow import SOWWorkflow
 
 __all__ = [
     "SOWState",
-    "VerificationResult", 
+    "VerificationResult",
     "SOWWorkflow",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the workflow and agents on first use to keep CLI start-up light."""
+    if name == "SOWWorkflow":
+        from .workflow import SOWWorkflow
+        return SOWWorkflow
+    # "from . import agents" would re-enter this hook for "agents" itself
+    agents = importlib.import_module(f"{__name__}.agents")
+    if name in agents.__all__:
+        return getattr(agents, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
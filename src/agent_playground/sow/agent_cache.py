@@ -0,0 +1,103 @@
+"""Content-addressed cache of SOW agent results."""
+
+import hashlib
+import mmap
+import os
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+# Number of agent results kept per process
+_MAX_ENTRIES = 256
+
+# Number of document digests kept per process
+_MAX_DIGESTS = 1024
+
+# Digest of a missing or unreadable document
+_NO_FILE = "-"
+
+# Most recently used document digests keyed by path, mtime and size
+_FILE_DIGESTS: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+
+
+def file_digest(path: Optional[str], data: Optional[memoryview] = None) -> str:
+    """
+    Hash a document's contents with BLAKE2b.
+
+    The latest digests are memoized on the file's mtime and size, so an
+    unchanged file is usually read only once and a modified one is always
+    re-hashed.
+
+    Args:
+        path: Document path, or None
+        data: Already mapped contents of the document, hashed instead of
+            mapping the file again
+
+    Returns:
+        Hex digest, or a placeholder for missing documents
+    """
+    if not path:
+        return _NO_FILE
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _NO_FILE
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _FILE_DIGESTS.get(key)
+    if digest is not None:
+        _FILE_DIGESTS.move_to_end(key)
+    else:
+        hasher = hashlib.blake2b(digest_size=16)
+        if data is not None:
+            hasher.update(data)
+        else:
+            try:
+                with open(path, "rb") as f:
+                    if stat.st_size:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            hasher.update(mm)
+            except OSError:
+                return _NO_FILE
+        digest = _FILE_DIGESTS[key] = hasher.hexdigest()
+        if len(_FILE_DIGESTS) > _MAX_DIGESTS:
+            _FILE_DIGESTS.popitem(last=False)
+    return digest
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a BLAKE2b cache key from an agent name and its relevant inputs."""
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+class AgentResultCache:
+    """LRU cache of the state updates returned by agent nodes.
+
+    Entries are stored pickled, so callers always get an independent copy they
+    are free to mutate.
+    """
+
+    def __init__(self, max_entries: int = _MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        payload = self._entries.get(key)
+        if payload is None:
+            return None
+        self._entries.move_to_end(key)
+        return pickle.loads(payload)
+
+    def put(self, key: str, update: Dict[str, Any]) -> None:
+        self._entries[key] = pickle.dumps(update, pickle.HIGHEST_PROTOCOL)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        _FILE_DIGESTS.clear()
+
+
+# Shared by all workflows in the process
+AGENT_CACHE = AgentResultCache()
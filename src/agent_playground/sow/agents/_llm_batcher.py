@@ -0,0 +1,140 @@
+"""Micro-batching of concurrent LLM calls for the SOW agents."""
+
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+
+class AsyncBatchQueue:
+    """
+    Coalesce concurrent requests into batched calls.
+
+    A request that arrives alone is dispatched straight away. When more are
+    already queued, requests are collected until either ``max_batch_size``
+    items are queued or ``max_wait_time`` seconds have passed since the first
+    one arrived, then handed to ``process_fn`` as a single list. The worker
+    task exits once the queue is drained and is restarted on demand, on
+    whichever event loop is running.
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch_size: int = 8,
+        max_wait_time: float = 0.05,
+    ):
+        """
+        Initialize the batch queue.
+
+        Args:
+            process_fn: Coroutine function taking a list of requests and
+                returning one result (or exception) per request, in order
+            max_batch_size: Maximum number of requests per batch
+            max_wait_time: Maximum seconds to wait for a batch to fill
+        """
+        self.process_fn = process_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _ensure_worker(self) -> None:
+        """Start the batching loop on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Requests queued on another loop can never be served from this one
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self.process_loop())
+
+    async def add_request(self, request: Any) -> asyncio.Future:
+        """
+        Queue a request for the next batch.
+
+        Args:
+            request: Single input for ``process_fn``
+
+        Returns:
+            Future resolved with the result for this request
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((request, future))
+        return future
+
+    async def process_loop(self) -> None:
+        """Collect requests into batches and dispatch them until the queue is empty."""
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+
+        while not queue.empty():
+            batch = [queue.get_nowait()]
+            deadline = loop.time() + self.max_wait_time
+
+            while len(batch) < self.max_batch_size:
+                if len(batch) == 1 and queue.empty():
+                    # A lone request is not held back waiting for company
+                    break
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            requests = [request for request, _ in batch]
+            try:
+                results = await self.process_fn(requests)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+
+# Batch queues by id of their chat model, then by call keyword arguments.
+# Entries are dropped when the model is garbage collected (chat models are
+# pydantic models and unhashable, so a WeakKeyDictionary cannot be used).
+_BATCHERS: Dict[int, Dict[Tuple[Tuple[str, Any], ...], AsyncBatchQueue]] = {}
+
+
+def get_batcher(llm: Any, **invoke_kwargs: Any) -> AsyncBatchQueue:
+    """
+    Get the shared batch queue for a chat model.
+
+    Args:
+        llm: LangChain chat model exposing ``abatch``
+        **invoke_kwargs: Extra keyword arguments passed to every call
+
+    Returns:
+        Batch queue dispatching to ``llm.abatch``
+    """
+    llm_id = id(llm)
+    batchers = _BATCHERS.get(llm_id)
+    if batchers is None:
+        batchers = _BATCHERS[llm_id] = {}
+        weakref.finalize(llm, _BATCHERS.pop, llm_id, None)
+
+    key = tuple(sorted(invoke_kwargs.items()))
+    batcher = batchers.get(key)
+    if batcher is None:
+        # Only a weak reference, so the queue does not keep the model alive
+        llm_ref = weakref.ref(llm)
+
+        async def process_fn(requests: List[Any]) -> List[Any]:
+            return await llm_ref().abatch(requests, return_exceptions=True, **invoke_kwargs)
+
+        batcher = batchers[key] = AsyncBatchQueue(process_fn)
+    return batcher
@@ -0,0 +1,75 @@
+"""Shared building blocks for Source of Wealth agents."""
+
+import asyncio
+import random
+from functools import cached_property
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
+
+from langchain_core.messages import BaseMessage
+
+from ..llm_limits import LIMITER, llm_semaphore
+from ..state import SOWState
+from ._llm_batcher import get_batcher
+
+
+_LLM_MAX_ATTEMPTS = 3
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Check whether an LLM error is a provider rate limit (HTTP 429 or quota)."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "rate limit" in message or "quota" in message
+
+
+class SOWNodeMixin:
+    """Mixin exposing an agent as a LangGraph node over ``SOWState``."""
+    
+    @cached_property
+    def node_config(self) -> Mapping[str, Any]:
+        """LangGraph node configuration, built once per agent instance and read-only."""
+        return MappingProxyType({
+            "name": self.name,
+            "function": self.process,
+            "input_schema": SOWState,
+            "output_schema": SOWState,
+        })
+    
+    def get_node_config(self) -> Dict[str, Any]:
+        """Get LangGraph node configuration as a new dict the caller may modify."""
+        return dict(self.node_config)
+
+
+class LLMCallMixin:
+    """Mixin giving agents a rate-limit aware LLM call."""
+    
+    async def _llm_call(self, messages: List[BaseMessage], **invoke_kwargs: Any) -> Any:
+        """
+        Invoke the agent's LLM, retrying rate-limited calls with backoff.
+        
+        Calls share the process-wide concurrency and rate limits.
+        
+        Args:
+            messages: Prompt messages
+            **invoke_kwargs: Extra keyword arguments for the model call
+            
+        Returns:
+            Model response message
+        """
+        batcher = get_batcher(self.llm, **invoke_kwargs)
+        for attempt in range(_LLM_MAX_ATTEMPTS):
+            try:
+                async with llm_semaphore():
+                    async with LIMITER:
+                        return await (await batcher.add_request(messages))
+            except Exception as e:
+                if attempt == _LLM_MAX_ATTEMPTS - 1 or not _is_rate_limit(e):
+                    raise
+                delay = min(8, 0.5 * 2 ** attempt) + random.random() * 0.1
+                self.logger.warning(f"LLM rate limited, retrying in {delay:.2f}s: {str(e)}")
+                await asyncio.sleep(delay)
@@ -1,13 +1,27 @@
 """Financial Reports Agent for Source of Wealth analysis."""
 
-from typing import Dict, Any, Optional
+from datetime import datetime
+from typing import Optional
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from .base import SOWNodeMixin
 from ..state import SOWState, FinancialReportResult
 
 
-class FinancialReportsAgent(BaseAgent):
+# Mock result is identical on every run, so it is validated once at import.
+_MOCK_FINANCIAL_REPORT = FinancialReportResult(
+    verified=True,
+    confidence_score=0.85,
+    reports_analyzed=["Bank Statement", "Tax Return"],
+    annual_income_range="$60,000 - $70,000",
+    investment_assets="$50,000",
+    credit_score="Good (720-750)",
+    financial_stability="stable"
+)
+
+
+class FinancialReportsAgent(SOWNodeMixin, BaseAgent):
     """Agent for analyzing financial reports."""
     
     def __init__(self, config: Optional[AgentConfig] = None):
@@ -22,31 +36,17 @@ class FinancialReportsAgent(BaseAgent):
         """Process financial report analysis for the given state."""
         self.logger.info(f"Starting financial report analysis for client: {state.client_name}")
         
-        # For now, use mock results
-        state.financial_reports = FinancialReportResult(
-            verified=True,
-            confidence_score=0.85,
-            reports_analyzed=["Bank Statement", "Tax Return"],
-            annual_income_range="$60,000 - $70,000",
-            investment_assets="$50,000",
-            credit_score="Good (720-750)",
-            financial_stability="stable"
+        # For now, use mock results (a deep copy, so callers never share the
+        # template's lists, with a current verification date)
+        state.financial_reports = _MOCK_FINANCIAL_REPORT.model_copy(
+            deep=True, update={"verification_date": datetime.now()}
         )
         
-        state.mark_step_completed("financial_reports")
-        state.add_message(
+        state.complete_step(
+            step="financial_reports",
             agent=self.name,
             message="Financial report analysis completed",
             message_type="success"
         )
         
         return state
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
@@ -1,13 +1,14 @@
 """Human Advisory Agent for Source of Wealth analysis."""
 
-from typing import Dict, Any, Optional
+from typing import Optional
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from .base import SOWNodeMixin
 from ..state import SOWState
 
 
-class HumanAdvisoryAgent(BaseAgent):
+class HumanAdvisoryAgent(SOWNodeMixin, BaseAgent):
     """Agent for handling human-in-the-loop interactions."""
     
     def __init__(self, config: Optional[AgentConfig] = None):
@@ -55,12 +56,3 @@ class HumanAdvisoryAgent(BaseAgent):
             return True
         
         return False
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
@@ -1,9 +1,11 @@
 """ID Verification Agent for Source of Wealth analysis."""
 
 import asyncio
+import os
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import base64
 import json
 
@@ -12,10 +14,56 @@ from PIL import Image
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from .base import SOWNodeMixin
 from ..state import SOWState, IDVerificationResult
 
 
-class IDVerificationAgent(BaseAgent):
+# Upper bound on ID document size; larger files are rejected before reading
+_MAX_ID_BYTES = 20 * 1024 * 1024
+
+# Total size of base64 payloads kept in memory across retries/replays
+_ENCODE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _Base64Cache:
+    """LRU cache of base64-encoded files bounded by total payload bytes.
+    
+    Keys include the file's mtime and size, so a modified file is never
+    served from a stale entry.
+    """
+    
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._bytes = 0
+    
+    def get(self, key: Tuple[str, int, int]) -> Optional[str]:
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        return payload
+    
+    def put(self, key: Tuple[str, int, int], payload: str) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = payload
+        self._bytes += len(payload)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+    
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+
+_encode_cache = _Base64Cache(_ENCODE_CACHE_MAX_BYTES)
+
+
+class IDVerificationAgent(SOWNodeMixin, BaseAgent):
     """Agent for verifying identity documents."""
     
     def __init__(self, config: Optional[AgentConfig] = None):
@@ -40,9 +88,10 @@ class IDVerificationAgent(BaseAgent):
                 )
                 return state
             
-            # Verify document exists
-            doc_path = Path(state.id_document_path)
-            if not doc_path.exists():
+            # Verify document exists and has a sane size (single stat call)
+            try:
+                st = os.stat(state.id_document_path)
+            except FileNotFoundError:
                 self.logger.error(f"ID document not found: {state.id_document_path}")
                 state.id_verification = IDVerificationResult(
                     verified=False,
@@ -50,13 +99,22 @@ class IDVerificationAgent(BaseAgent):
                 )
                 return state
             
+            if st.st_size == 0 or st.st_size > _MAX_ID_BYTES:
+                self.logger.error(f"ID document has invalid size ({st.st_size} bytes): {state.id_document_path}")
+                state.id_verification = IDVerificationResult(
+                    verified=False,
+                    issues_found=[f"Document size out of bounds ({st.st_size} bytes): {state.id_document_path}"]
+                )
+                return state
+            
             # Process the document
-            verification_result = await self._analyze_id_document(doc_path, state)
+            doc_path = Path(state.id_document_path)
+            verification_result = await self._analyze_id_document(doc_path, state, st)
             state.id_verification = verification_result
             
             # Add progress tracking
-            state.mark_step_completed("id_verification")
-            state.add_message(
+            state.complete_step(
+                step="id_verification",
                 agent=self.name,
                 message=f"ID verification completed with result: {verification_result.verified}",
                 message_type="success" if verification_result.verified else "warning"
@@ -73,7 +131,12 @@ class IDVerificationAgent(BaseAgent):
             )
             return state
     
-    async def _analyze_id_document(self, doc_path: Path, state: SOWState) -> IDVerificationResult:
+    async def _analyze_id_document(
+        self,
+        doc_path: Path,
+        state: SOWState,
+        st: Optional[os.stat_result] = None
+    ) -> IDVerificationResult:
         """Analyze the ID document using AI model."""
         
         try:
@@ -82,7 +145,7 @@ class IDVerificationAgent(BaseAgent):
                 return self._get_mock_result(state.client_id)
             
             # Read and encode image
-            image_data = self._encode_image(doc_path)
+            image_data = self._encode_image(doc_path, st, state.documents.get(state.id_document_path))
             
             # Prepare AI prompt
             system_prompt = self._get_system_prompt()
@@ -121,11 +184,29 @@ class IDVerificationAgent(BaseAgent):
                 issues_found=[f"Analysis error: {str(e)}"]
             )
     
-    def _encode_image(self, image_path: Path) -> str:
-        """Encode image to base64."""
+    def _encode_image(
+        self,
+        image_path: Path,
+        st: Optional[os.stat_result] = None,
+        data: Optional[memoryview] = None
+    ) -> str:
+        """Encode image to base64, reusing cached payloads for unchanged files."""
         try:
-            with open(image_path, "rb") as image_file:
-                return base64.b64encode(image_file.read()).decode('utf-8')
+            if st is None:
+                st = os.stat(image_path)
+            key = (os.path.abspath(image_path), st.st_mtime_ns, st.st_size)
+            payload = _encode_cache.get(key)
+            if payload is None and data is not None:
+                # The workflow already mapped the file
+                payload = base64.b64encode(data).decode('utf-8')
+                _encode_cache.put(key, payload)
+            elif payload is None:
+                with open(image_path, "rb") as image_file:
+                    buffer = bytearray(st.st_size)
+                    read = image_file.readinto(buffer)
+                payload = base64.b64encode(memoryview(buffer)[:read]).decode('utf-8')
+                _encode_cache.put(key, payload)
+            return payload
         except Exception as e:
             raise Exception(f"Failed to encode image: {str(e)}")
     
@@ -223,12 +304,3 @@ class IDVerificationAgent(BaseAgent):
         })
         
         return IDVerificationResult(**data)
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
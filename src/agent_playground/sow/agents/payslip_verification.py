@@ -1,22 +1,130 @@
 """Payslip Verification Agent for Source of Wealth analysis."""
 
 import asyncio
+import hashlib
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-import json
+from types import MappingProxyType
+from typing import Dict, Optional, List
 import re
 
+import pymupdf
 from langchain_core.messages import HumanMessage, SystemMessage
+from pydantic import BaseModel, Field
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from ...utils.serialization import find_json_object, JSONDecodeError
+from .base import LLMCallMixin, SOWNodeMixin
+from ..llm_limits import env_limit, per_loop_semaphore
 from ..state import SOWState, PayslipVerificationResult
 
 
-class PayslipVerificationAgent(BaseAgent):
+# Static prompt prefix; kept byte-identical across calls so providers can
+# reuse their prompt cache for it.
+_SYSTEM_PROMPT = """
+        You are an expert payslip verification agent. Your task is to analyze payslip documents and extract relevant employment and income information.
+        
+        Please analyze the provided payslip document and return a JSON response with the following structure:
+        {
+            "verified": boolean,
+            "confidence": float (0.0-1.0),
+            "monthly_income": float,
+            "employer": string,
+            "position": string,
+            "pay_period": string,
+            "deductions": {
+                "tax": float,
+                "social_security": float,
+                "other": float
+            },
+            "issues": [list of any issues found]
+        }
+        
+        Look for:
+        - Employer name and authenticity
+        - Employee name matching
+        - Gross and net pay amounts
+        - Pay period (weekly, bi-weekly, monthly)
+        - Tax and other deductions
+        - Consistency in formatting and data
+        - Any signs of tampering or forgery
+        """
+
+_PROMPT_CACHE_KEY = hashlib.sha1(_SYSTEM_PROMPT.encode()).hexdigest()
+
+class PayslipAnalysis(BaseModel):
+    """Typed schema for the model's payslip analysis JSON."""
+    verified: bool = False
+    confidence: float = 0.0
+    monthly_income: Optional[float] = None
+    employer: Optional[str] = None
+    position: Optional[str] = None
+    pay_period: Optional[str] = None
+    deductions: Dict[str, float] = Field(default_factory=dict)
+    issues: List[str] = Field(default_factory=list)
+
+# Fallback extraction patterns for unstructured responses. Income is matched
+# against the casefolded response; the employer name keeps its original case.
+_INCOME_RE = re.compile(r'income[:\s]+(\d+[.,]\d+|\d+)')
+_EMPLOYER_RE = re.compile(r'employer[:\s]+([^\n]+)', re.IGNORECASE)
+
+# Caps concurrent OCR subprocesses across all agent instances on the running event loop
+_ocr_semaphore = per_loop_semaphore(env_limit("OCR_CONCURRENCY", os.cpu_count() or 1))
+
+
+def _pdf_extract(doc_path: str, data: Optional[memoryview] = None) -> str:
+    """Extract the text layer of every page in a PDF (runs in a worker thread)."""
+    source = {"stream": data, "filetype": "pdf"} if data is not None else {"filename": doc_path}
+    with pymupdf.open(**source) as doc:
+        return "\n".join(page.get_text() for page in doc)
+
+
+async def _ocr_extract(doc_path: Path) -> str:
+    """Run tesseract on an image in a subprocess, bounded by ``_ocr_semaphore``."""
+    async with _ocr_semaphore():
+        proc = await asyncio.create_subprocess_exec(
+            "tesseract", str(doc_path), "stdout",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
+    if proc.returncode != 0:
+        raise RuntimeError(stderr.decode(errors="replace").strip() or "tesseract failed")
+    return stdout.decode(errors="replace")
+
+
+# Mock results never change, so they are validated once at import.
+_MOCK_PAYSLIP_BY_ID = MappingProxyType({
+    "12345": PayslipVerificationResult(
+        verified=True,
+        confidence_score=0.92,
+        monthly_income=5500.0,
+        employer="Tech Corp Inc.",
+        position="Software Engineer",
+        pay_period="monthly",
+        deductions={
+            "tax": 1100.0,
+            "social_security": 330.0,
+            "health_insurance": 200.0
+        },
+        issues_found=[]
+    ),
+})
+_MOCK_PAYSLIP_DEFAULT = PayslipVerificationResult(
+    verified=False,
+    confidence_score=0.0,
+    issues_found=["Mock data not available for this client"]
+)
+
+
+class PayslipVerificationAgent(LLMCallMixin, SOWNodeMixin, BaseAgent):
     """Agent for verifying payslip documents."""
     
+    # Built once; the prompt never changes between calls
+    _SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_PROMPT)
+    
     def __init__(self, config: Optional[AgentConfig] = None):
         super().__init__(
             name="payslip_verification_agent",
@@ -31,7 +139,8 @@ class PayslipVerificationAgent(BaseAgent):
         
         try:
             # Check if payslip document path is provided
-            if not state.payslip_document_path:
+            doc_path = state.payslip_document_path
+            if not doc_path:
                 self.logger.warning("No payslip document path provided")
                 state.payslip_verification = PayslipVerificationResult(
                     verified=False,
@@ -39,9 +148,8 @@ class PayslipVerificationAgent(BaseAgent):
                 )
                 return state
             
-            # Verify document exists
-            doc_path = Path(state.payslip_document_path)
-            if not doc_path.exists():
+            # Verify document exists (plain os.path avoids a Path allocation on the reject path)
+            if not os.path.exists(doc_path):
                 self.logger.error(f"Payslip document not found: {state.payslip_document_path}")
                 state.payslip_verification = PayslipVerificationResult(
                     verified=False,
@@ -50,12 +158,12 @@ class PayslipVerificationAgent(BaseAgent):
                 return state
             
             # Process the document
-            verification_result = await self._analyze_payslip_document(doc_path, state)
+            verification_result = await self._analyze_payslip_document(Path(doc_path), state)
             state.payslip_verification = verification_result
             
             # Add progress tracking
-            state.mark_step_completed("payslip_verification")
-            state.add_message(
+            state.complete_step(
+                step="payslip_verification",
                 agent=self.name,
                 message=f"Payslip verification completed with result: {verification_result.verified}",
                 message_type="success" if verification_result.verified else "warning"
@@ -81,32 +189,33 @@ class PayslipVerificationAgent(BaseAgent):
                 return self._get_mock_result(state.client_id)
             
             # Extract text from document (assuming PDF/image processing)
-            document_text = await self._extract_document_text(doc_path)
+            document_text = await self._extract_document_text(
+                doc_path, state.documents.get(state.payslip_document_path)
+            )
             
             # Prepare AI prompt
-            system_prompt = self._get_system_prompt()
             human_prompt = self._get_human_prompt(state.client_name, document_text)
             
             # Create messages
             messages = [
-                SystemMessage(content=system_prompt),
+                self._SYSTEM_MESSAGE,
                 HumanMessage(content=human_prompt)
             ]
             
             # Get AI analysis
-            response = await self.llm.ainvoke(messages)
+            response = await self._llm_call(messages, prompt_cache_key=_PROMPT_CACHE_KEY)
             analysis = self._parse_ai_response(response.content)
             
             # Create verification result
             return PayslipVerificationResult(
-                verified=analysis.get("verified", False),
-                confidence_score=analysis.get("confidence", 0.0),
-                monthly_income=analysis.get("monthly_income"),
-                employer=analysis.get("employer"),
-                position=analysis.get("position"),
-                pay_period=analysis.get("pay_period"),
-                deductions=analysis.get("deductions", {}),
-                issues_found=analysis.get("issues", [])
+                verified=analysis.verified,
+                confidence_score=analysis.confidence,
+                monthly_income=analysis.monthly_income,
+                employer=analysis.employer,
+                position=analysis.position,
+                pay_period=analysis.pay_period,
+                deductions=analysis.deductions,
+                issues_found=analysis.issues
             )
             
         except Exception as e:
@@ -116,50 +225,24 @@ class PayslipVerificationAgent(BaseAgent):
                 issues_found=[f"Analysis error: {str(e)}"]
             )
     
-    async def _extract_document_text(self, doc_path: Path) -> str:
-        """Extract text from document (placeholder for OCR/PDF parsing)."""
-        # This would integrate with PyMuPDF, OCR, or other text extraction tools
-        # For now, return a placeholder
+    async def _extract_document_text(self, doc_path: Path, data: Optional[memoryview] = None) -> str:
+        """Extract text from document without blocking the event loop."""
         try:
             if doc_path.suffix.lower() == '.pdf':
-                # TODO: Implement PDF text extraction
-                return f"[PDF content from {doc_path.name}]"
+                return await asyncio.to_thread(_pdf_extract, os.fspath(doc_path), data)
             else:
-                # TODO: Implement OCR for images
-                return f"[Image content from {doc_path.name}]"
+                try:
+                    return await _ocr_extract(doc_path)
+                except FileNotFoundError:
+                    # tesseract is not installed; let the model work from the file name
+                    self.logger.warning("tesseract not found, skipping OCR")
+                    return f"[Image content from {doc_path.name}]"
         except Exception as e:
             raise Exception(f"Failed to extract text from document: {str(e)}")
     
     def _get_system_prompt(self) -> str:
         """Get system prompt for payslip verification."""
-        return """
-        You are an expert payslip verification agent. Your task is to analyze payslip documents and extract relevant employment and income information.
-        
-        Please analyze the provided payslip document and return a JSON response with the following structure:
-        {
-            "verified": boolean,
-            "confidence": float (0.0-1.0),
-            "monthly_income": float,
-            "employer": string,
-            "position": string,
-            "pay_period": string,
-            "deductions": {
-                "tax": float,
-                "social_security": float,
-                "other": float
-            },
-            "issues": [list of any issues found]
-        }
-        
-        Look for:
-        - Employer name and authenticity
-        - Employee name matching
-        - Gross and net pay amounts
-        - Pay period (weekly, bi-weekly, monthly)
-        - Tax and other deductions
-        - Consistency in formatting and data
-        - Any signs of tampering or forgery
-        """
+        return _SYSTEM_PROMPT
     
     def _get_human_prompt(self, client_name: str, document_text: str) -> str:
         """Get human prompt for payslip verification."""
@@ -180,67 +263,35 @@ class PayslipVerificationAgent(BaseAgent):
         Provide your analysis in the JSON format specified in the system prompt.
         """
     
-    def _parse_ai_response(self, response: str) -> Dict[str, Any]:
+    def _parse_ai_response(self, response: str) -> PayslipAnalysis:
         """Parse AI response into structured data."""
         try:
             # Try to extract JSON from response
-            start_idx = response.find('{')
-            end_idx = response.rfind('}') + 1
-            
-            if start_idx != -1 and end_idx != -1:
-                json_str = response[start_idx:end_idx]
-                return json.loads(json_str)
+            parsed = find_json_object(response)
+            if parsed is not None:
+                return PayslipAnalysis.model_validate(parsed)
             else:
                 # Fallback parsing with regex
-                income_match = re.search(r'income[:\s]+(\d+[.,]\d+|\d+)', response, re.IGNORECASE)
-                employer_match = re.search(r'employer[:\s]+([^\n]+)', response, re.IGNORECASE)
+                folded = response.casefold()
+                income_match = _INCOME_RE.search(folded)
+                employer_match = _EMPLOYER_RE.search(response)
                 
-                return {
-                    "verified": "valid" in response.lower() or "legitimate" in response.lower(),
-                    "confidence": 0.5,
-                    "monthly_income": float(income_match.group(1).replace(',', '')) if income_match else None,
-                    "employer": employer_match.group(1).strip() if employer_match else None,
-                    "issues": ["Could not parse structured response"]
-                }
-        except (json.JSONDecodeError, ValueError) as e:
-            return {
-                "verified": False,
-                "confidence": 0.0,
-                "issues": [f"Invalid response format: {str(e)}"]
-            }
+                return PayslipAnalysis(
+                    verified="valid" in folded or "legitimate" in folded,
+                    confidence=0.5,
+                    monthly_income=float(income_match.group(1).replace(',', '')) if income_match else None,
+                    employer=employer_match.group(1).strip() if employer_match else None,
+                    issues=["Could not parse structured response"]
+                )
+        except (JSONDecodeError, ValueError) as e:
+            return PayslipAnalysis(
+                verified=False,
+                confidence=0.0,
+                issues=[f"Invalid response format: {str(e)}"]
+            )
     
     def _get_mock_result(self, client_id: str) -> PayslipVerificationResult:
         """Get mock verification result for testing."""
-        mock_data = {
-            "12345": {
-                "verified": True,
-                "confidence_score": 0.92,
-                "monthly_income": 5500.0,
-                "employer": "Tech Corp Inc.",
-                "position": "Software Engineer",
-                "pay_period": "monthly",
-                "deductions": {
-                    "tax": 1100.0,
-                    "social_security": 330.0,
-                    "health_insurance": 200.0
-                },
-                "issues_found": []
-            }
-        }
-        
-        data = mock_data.get(client_id, {
-            "verified": False,
-            "confidence_score": 0.0,
-            "issues_found": ["Mock data not available for this client"]
-        })
-        
-        return PayslipVerificationResult(**data)
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
+        mock = _MOCK_PAYSLIP_BY_ID.get(client_id, _MOCK_PAYSLIP_DEFAULT)
+        # Deep copy, so deductions and issues_found are not shared with the template
+        return mock.model_copy(deep=True, update={"verification_date": datetime.now()})
@@ -1,14 +1,22 @@
 """Report Generation Agent for Source of Wealth analysis."""
 
+import io
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Optional
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from .base import SOWNodeMixin
 from ..state import SOWState
 
 
-class ReportGenerationAgent(BaseAgent):
+def _status(verified: bool, ok: str = "✅ VERIFIED", failed: str = "❌ FAILED") -> str:
+    """Format a verification status badge."""
+    return ok if verified else failed
+
+
+class ReportGenerationAgent(SOWNodeMixin, BaseAgent):
     """Agent for generating final SOW reports."""
     
     def __init__(self, config: Optional[AgentConfig] = None):
@@ -31,8 +39,8 @@ class ReportGenerationAgent(BaseAgent):
         summary = self._generate_summary(state)
         state.summary = summary
         
-        state.mark_step_completed("report_generation")
-        state.add_message(
+        state.complete_step(
+            step="report_generation",
             agent=self.name,
             message="Final report generated successfully",
             message_type="success"
@@ -40,56 +48,54 @@ class ReportGenerationAgent(BaseAgent):
         
         return state
     
-    def _generate_report(self, state: SOWState) -> str:
-        """Generate detailed SOW report."""
-        report_parts = [
-            f"# Source of Wealth Analysis Report",
-            f"**Client:** {state.client_name}",
-            f"**Client ID:** {state.client_id}",
-            f"**Report Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"**Analysis Progress:** {state.get_progress_percentage():.1f}%",
-            "",
-            "## Executive Summary",
-        ]
+    def _generate_report(self, state: SOWState, now: Optional[datetime] = None) -> str:
+        """Generate detailed SOW report; pass ``now`` to share one timestamp across a batch."""
+        if now is None:
+            timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
+        else:
+            timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        
+        buf = io.StringIO()
+        w = buf.write
+        
+        w("# Source of Wealth Analysis Report\n")
+        w(f"**Client:** {state.client_name}\n")
+        w(f"**Client ID:** {state.client_id}\n")
+        w(f"**Report Date:** {timestamp}\n")
+        w(f"**Analysis Progress:** {state.get_progress_percentage():.1f}%\n")
+        w("\n## Executive Summary\n")
         
         # Add risk assessment summary
-        if state.risk_assessment:
-            report_parts.extend([
-                f"**Risk Level:** {state.risk_assessment.risk_level.upper()}",
-                f"**Risk Score:** {state.risk_assessment.risk_score}/100",
-                ""
-            ])
+        risk = state.risk_assessment
+        if risk:
+            w(f"**Risk Level:** {risk.risk_level.upper()}\n")
+            w(f"**Risk Score:** {risk.risk_score}/100\n\n")
         
         # Add verification results
-        report_parts.append("## Verification Results")
+        w("## Verification Results")
         
         if state.id_verification:
-            status = "✅ VERIFIED" if state.id_verification.verified else "❌ FAILED"
-            report_parts.append(f"**ID Verification:** {status}")
+            w(f"\n**ID Verification:** {_status(state.id_verification.verified)}")
         
-        if state.payslip_verification:
-            status = "✅ VERIFIED" if state.payslip_verification.verified else "❌ FAILED"
-            report_parts.append(f"**Payslip Verification:** {status}")
-            if state.payslip_verification.monthly_income:
-                report_parts.append(f"  - Monthly Income: ${state.payslip_verification.monthly_income:,.2f}")
+        payslip = state.payslip_verification
+        if payslip:
+            w(f"\n**Payslip Verification:** {_status(payslip.verified)}")
+            if payslip.monthly_income:
+                w(f"\n  - Monthly Income: ${payslip.monthly_income:,.2f}")
         
         if state.web_references:
-            status = "✅ FOUND" if state.web_references.verified else "❌ NOT FOUND"
-            report_parts.append(f"**Web References:** {status}")
+            w(f"\n**Web References:** {_status(state.web_references.verified, '✅ FOUND', '❌ NOT FOUND')}")
         
         if state.financial_reports:
-            status = "✅ VERIFIED" if state.financial_reports.verified else "❌ FAILED"
-            report_parts.append(f"**Financial Reports:** {status}")
+            w(f"\n**Financial Reports:** {_status(state.financial_reports.verified)}")
         
         # Add recommendations
-        if state.risk_assessment and state.risk_assessment.recommendations:
-            report_parts.extend([
-                "",
-                "## Recommendations",
-                *[f"- {rec}" for rec in state.risk_assessment.recommendations]
-            ])
+        if risk and risk.recommendations:
+            w("\n\n## Recommendations")
+            for rec in risk.recommendations:
+                w(f"\n- {rec}")
         
-        return "\n".join(report_parts)
+        return buf.getvalue()
     
     def _generate_summary(self, state: SOWState) -> str:
         """Generate executive summary."""
@@ -101,12 +107,3 @@ class ReportGenerationAgent(BaseAgent):
         else:
             return f"Source of Wealth analysis initiated for {state.client_name}. " \
                    f"Analysis progress: {state.get_progress_percentage():.1f}%."
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
@@ -1,13 +1,14 @@
 """Web References Agent for Source of Wealth analysis."""
 
-from typing import Dict, Any, Optional
+from typing import Optional
 
 from ...core.base import BaseAgent, AgentConfig
 from ...utils.logging import get_logger
+from .base import SOWNodeMixin
 from ..state import SOWState, WebReferenceResult
 
 
-class WebReferencesAgent(BaseAgent):
+class WebReferencesAgent(SOWNodeMixin, BaseAgent):
     """Agent for searching and analyzing web references."""
     
     def __init__(self, config: Optional[AgentConfig] = None):
@@ -32,20 +33,11 @@ class WebReferencesAgent(BaseAgent):
             credibility_score=0.8
         )
         
-        state.mark_step_completed("web_references")
-        state.add_message(
+        state.complete_step(
+            step="web_references",
             agent=self.name,
             message="Web reference search completed",
             message_type="success"
         )
         
         return state
-    
-    def get_node_config(self) -> Dict[str, Any]:
-        """Get LangGraph node configuration."""
-        return {
-            "name": self.name,
-            "function": self.process,
-            "input_schema": SOWState,
-            "output_schema": SOWState,
-        }
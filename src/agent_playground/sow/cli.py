@@ -1,23 +1,45 @@
 """Source of Wealth (SOW) Agent CLI implementation."""
 
 import asyncio
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Optional, Union
 
 import click
 from pydantic import BaseModel
 
 from ..utils.logging import get_logger
 from ..utils.config import get_settings
-from .workflow import SOWWorkflow
-from .state import SOWState, SOWDocuments
+from ..utils.serialization import json_dumps, json_loads
+from .state import SOWState, SOWDocuments, _SOW_DOC_FIELDS
 
 
 logger = get_logger(__name__)
 
 
+def __getattr__(name: str) -> Any:
+    """Resolve names that used to be imported eagerly at module load."""
+    if name == "SOWWorkflow":
+        from .workflow import SOWWorkflow
+        return SOWWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_legacy():
+    """Import the original SOW runner once and return its entry points."""
+    legacy_path = '/workspaces/agent-playground/source_of_wealth_agent'
+    if legacy_path not in sys.path:
+        sys.path.append(legacy_path)
+    
+    from source_of_wealth_agent.workflow.runner import run_workflow
+    from source_of_wealth_agent.core.state import create_initial_state
+    
+    return run_workflow, create_initial_state
+
+
 class SOWVerificationRequest(BaseModel):
     """Request model for SOW verification."""
     client_id: str
@@ -89,37 +111,21 @@ def verify(ctx, client_id: str, client_name: str,
     
     # Prepare document paths
     documents = SOWDocuments()
-    
-    if id_document:
-        documents.id_document = Path(id_document).resolve()
-        if verbose:
-            click.echo(f"ID document: {documents.id_document}")
-    
-    if payslip:
-        documents.payslip = Path(payslip).resolve()
-        if verbose:
-            click.echo(f"Payslip: {documents.payslip}")
-    
-    if bank_statement:
-        documents.bank_statement = Path(bank_statement).resolve()
-        if verbose:
-            click.echo(f"Bank statement: {documents.bank_statement}")
-    
-    if employment_letter:
-        documents.employment_letter = Path(employment_letter).resolve()
-        if verbose:
-            click.echo(f"Employment letter: {documents.employment_letter}")
-    
-    if tax_document:
-        documents.tax_document = Path(tax_document).resolve()
-        if verbose:
-            click.echo(f"Tax document: {documents.tax_document}")
-    
-    # Verify all document files exist and are readable
-    for doc_name, doc_path in documents.dict().items():
-        if doc_path and not os.access(doc_path, os.R_OK):
-            click.echo(f"Error: Cannot read {doc_name} at {doc_path}", err=True)
-            sys.exit(1)
+    resolved = []
+    for value, attr, label in (
+        (id_document, "id_document", "ID document"),
+        (payslip, "payslip", "Payslip"),
+        (bank_statement, "bank_statement", "Bank statement"),
+        (employment_letter, "employment_letter", "Employment letter"),
+        (tax_document, "tax_document", "Tax document"),
+    ):
+        if value:
+            path = Path(os.path.realpath(value))
+            setattr(documents, attr, path)
+            resolved.append(f"{label}: {path}")
+    
+    if verbose and resolved:
+        click.echo("\n".join(resolved))
     
     # Create verification request
     request = SOWVerificationRequest(
@@ -129,8 +135,8 @@ def verify(ctx, client_id: str, client_name: str,
     )
     
     try:
-        # Run the verification workflow
-        result = asyncio.run(_run_verification(request, interactive, verbose))
+        # Check document readability, then run the verification workflow
+        result = asyncio.run(_validate_and_run(request, interactive, verbose))
         
         # Output results
         if output:
@@ -146,17 +152,26 @@ def verify(ctx, client_id: str, client_name: str,
         sys.exit(1)
 
 
+async def _validate_and_run(request: SOWVerificationRequest, interactive: bool, verbose: bool) -> dict:
+    """Verify all document files are readable, then run the SOW verification workflow."""
+    documents = request.documents
+    paths = [(name, path) for name in _SOW_DOC_FIELDS if (path := getattr(documents, name))]
+    readable = await asyncio.gather(*(asyncio.to_thread(os.access, path, os.R_OK) for _, path in paths))
+    for (doc_name, doc_path), ok in zip(paths, readable):
+        if not ok:
+            click.echo(f"Error: Cannot read {doc_name} at {doc_path}", err=True)
+            sys.exit(1)
+    
+    return await _run_verification(request, interactive, verbose)
+
+
 async def _run_verification(request: SOWVerificationRequest, interactive: bool, verbose: bool) -> dict:
     """Run the SOW verification workflow."""
     if verbose:
         click.echo("Initializing SOW workflow...")
     
     # Import the original runner functionality
-    import sys
-    sys.path.append('/workspaces/agent-playground/source_of_wealth_agent')
-    
-    from source_of_wealth_agent.workflow.runner import run_workflow
-    from source_of_wealth_agent.core.state import create_initial_state
+    run_workflow, create_initial_state = _load_legacy()
     
     # Create initial state for the original workflow
     initial_state = create_initial_state(request.client_id, request.client_name)
@@ -182,7 +197,8 @@ async def _run_verification(request: SOWVerificationRequest, interactive: bool,
         if verbose:
             click.echo("Verification workflow completed")
         
-        return final_state
+        # Normalize to plain JSON types in one encoder pass (numpy, datetimes, models)
+        return json_loads(json_dumps(final_state))
         
     except Exception as e:
         if verbose:
@@ -197,13 +213,14 @@ async def _run_verification(request: SOWVerificationRequest, interactive: bool,
         }
 
 
-def _save_results(result: dict, output_path: str, verbose: bool):
+def _save_results(result: Union[dict, BaseModel], output_path: str, verbose: bool):
     """Save verification results to a file."""
-    import json
-    
     try:
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
+        if isinstance(result, BaseModel):
+            # pydantic-core serializes the model in a single pass
+            Path(output_path).write_text(result.model_dump_json(indent=2))
+        else:
+            Path(output_path).write_bytes(json_dumps(result, indent=True))
         
         if verbose:
             click.echo(f"Results saved to: {output_path}")
@@ -217,61 +234,67 @@ def _save_results(result: dict, output_path: str, verbose: bool):
 
 def _display_results(result: dict, verbose: bool):
     """Display verification results to the console."""
-    click.echo("\n" + "="*60)
-    click.echo("SOW VERIFICATION RESULTS")
-    click.echo("="*60)
+    out: List[str] = []
+    out.append("\n" + "="*60)
+    out.append("SOW VERIFICATION RESULTS")
+    out.append("="*60)
+    
+    # Look up every top-level field once
+    get = result.get
+    client_id = get('client_id', 'Unknown')
+    client_name = get('client_name', 'Unknown')
+    current_step = get('current_step', 'Unknown')
+    progress = get('progress_percentage', 0)
+    risk_assessment = get('risk_assessment')
+    verification_results = (
+        ('ID Verification', get('id_verification')),
+        ('Payslip Verification', get('payslip_verification')),
+        ('Web References', get('web_references')),
+        ('Financial Reports', get('financial_reports')),
+    )
     
     # Display key information
-    client_id = result.get('client_id', 'Unknown')
-    client_name = result.get('client_name', 'Unknown')
-    current_step = result.get('current_step', 'Unknown')
-    progress = result.get('progress_percentage', 0)
     
-    click.echo(f"Client ID: {client_id}")
-    click.echo(f"Client Name: {client_name}")
-    click.echo(f"Current Step: {current_step}")
-    click.echo(f"Progress: {progress:.1f}%")
+    out.append(f"Client ID: {client_id}")
+    out.append(f"Client Name: {client_name}")
+    out.append(f"Current Step: {current_step}")
+    out.append(f"Progress: {progress:.1f}%")
     
     # Display risk assessment if available
-    risk_assessment = result.get('risk_assessment')
     if risk_assessment:
-        click.echo(f"Risk Level: {risk_assessment.get('risk_level', 'Unknown')}")
-        click.echo(f"Risk Score: {risk_assessment.get('risk_score', 'N/A')}")
+        out.append(f"Risk Level: {risk_assessment.get('risk_level', 'Unknown')}")
+        out.append(f"Risk Score: {risk_assessment.get('risk_score', 'N/A')}")
     
     # Display verification details if available
-    verification_statuses = {}
-    if result.get('id_verification'):
-        verification_statuses['ID Verification'] = result['id_verification'].get('verified', False)
-    if result.get('payslip_verification'):
-        verification_statuses['Payslip Verification'] = result['payslip_verification'].get('verified', False)
-    if result.get('web_references'):
-        verification_statuses['Web References'] = result['web_references'].get('verified', False)
-    if result.get('financial_reports'):
-        verification_statuses['Financial Reports'] = result['financial_reports'].get('verified', False)
+    verification_statuses = {
+        verification_type: verification.get('verified', False)
+        for verification_type, verification in verification_results
+        if verification
+    }
     
     if verification_statuses:
-        click.echo("\nVerification Details:")
-        click.echo("-" * 30)
+        out.append("\nVerification Details:")
+        out.append("-" * 30)
         for verification_type, status in verification_statuses.items():
             status_str = "✓ Verified" if status else "✗ Failed"
-            click.echo(f"  {verification_type}: {status_str}")
+            out.append(f"  {verification_type}: {status_str}")
     
     # Display recommendations if available
     if risk_assessment and risk_assessment.get('recommendations'):
         recommendations = risk_assessment['recommendations']
-        click.echo("\nRecommendations:")
-        click.echo("-" * 30)
+        out.append("\nRecommendations:")
+        out.append("-" * 30)
         for i, rec in enumerate(recommendations, 1):
-            click.echo(f"  {i}. {rec}")
+            out.append(f"  {i}. {rec}")
     
     # Display full results in verbose mode
     if verbose:
-        click.echo("\nFull Results (JSON):")
-        click.echo("-" * 30)
-        import json
-        click.echo(json.dumps(result, indent=2, default=str))
+        out.append("\nFull Results (JSON):")
+        out.append("-" * 30)
+        out.append(json_dumps(result, indent=True).decode())
     
-    click.echo("="*60)
+    out.append("="*60)
+    click.echo("\n".join(out))
 
 
 @main.command()
@@ -290,6 +313,7 @@ def status():
     
     # Check workflow availability
     try:
+        from .workflow import SOWWorkflow
         workflow = SOWWorkflow()
         click.echo("✓ SOW workflow initialized successfully")
     except Exception as e:
@@ -2,17 +2,15 @@
 
 import asyncio
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich import print as rprint
 
-from ..utils import get_settings, setup_logging
-from .workflow import SOWWorkflow, create_sow_workflow
-from .state import SOWState
+from ..utils import setup_logging
+from .state import SOWFlag
+
+if TYPE_CHECKING:
+    from .state import SOWState
 
 app = typer.Typer(
     name="sow-agent",
@@ -22,6 +20,20 @@ app = typer.Typer(
 
 console = Console()
 
+# Set once setup_logging() has run in this process
+_LOGGING_DONE = False
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve names that used to be imported eagerly at module load."""
+    if name in ("SOWWorkflow", "create_sow_workflow"):
+        from . import workflow
+        return getattr(workflow, name)
+    if name == "SOWState":
+        from .state import SOWState
+        return SOWState
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 @app.command()
 def analyze(
@@ -34,10 +46,13 @@ def analyze(
     output_file: Optional[str] = typer.Option(None, "--output", help="Output file for report"),
 ):
     """Run Source of Wealth analysis for a client."""
+    from rich.panel import Panel
     
     # Setup
-    setup_logging()
-    settings = get_settings()
+    global _LOGGING_DONE
+    if not _LOGGING_DONE:
+        setup_logging()
+        _LOGGING_DONE = True
     
     console.print(Panel(
         f"[bold blue]Source of Wealth Analysis[/bold blue]\n"
@@ -98,13 +113,18 @@ async def _run_analysis(
     payslip_document_path: Optional[str] = None,
     financial_report_paths: Optional[list] = None,
     use_mock: bool = False
-) -> SOWState:
+) -> "SOWState":
     """Run the SOW analysis workflow."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    
+    from .workflow import create_sow_workflow
     
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
+        refresh_per_second=4,
+        transient=True,
     ) as progress:
         
         task = progress.add_task("Initializing SOW workflow...", total=None)
@@ -123,54 +143,60 @@ async def _run_analysis(
             payslip_document_path=payslip_document_path,
             financial_report_paths=financial_report_paths or []
         )
-        
-        progress.update(task, description="Analysis completed!", advance=100)
     
     return result
 
 
-def _display_results(state: SOWState):
+def _display_results(state: "SOWState"):
     """Display analysis results in a formatted way."""
+    from rich.table import Table
     
     # Overall status
     console.print(f"\n[bold green]Analysis Complete[/bold green]")
     console.print(f"Progress: {state.get_progress_percentage():.1f}%")
     
-    # Verification Results Table
-    table = Table(title="Verification Results")
-    table.add_column("Component", style="cyan", no_wrap=True)
-    table.add_column("Status", style="green")
-    table.add_column("Details", style="white")
+    # Verification Results rows, built before the table
+    rows = []
     
     # ID Verification
-    if state.id_verification:
-        status = "✅ VERIFIED" if state.id_verification.verified else "❌ FAILED"
-        details = f"Confidence: {state.id_verification.confidence_score:.2f}"
-        if state.id_verification.issues_found:
-            details += f", Issues: {len(state.id_verification.issues_found)}"
-        table.add_row("ID Verification", status, details)
+    id_result = state.id_verification
+    if id_result:
+        details = [f"Confidence: {id_result.confidence_score:.2f}"]
+        if id_result.issues_found:
+            details.append(f", Issues: {len(id_result.issues_found)}")
+        rows.append(("ID Verification", "✅ VERIFIED" if id_result.verified else "❌ FAILED", "".join(details)))
     
     # Payslip Verification
-    if state.payslip_verification:
-        status = "✅ VERIFIED" if state.payslip_verification.verified else "❌ FAILED"
-        details = f"Confidence: {state.payslip_verification.confidence_score:.2f}"
-        if state.payslip_verification.monthly_income:
-            details += f", Income: ${state.payslip_verification.monthly_income:,.2f}"
-        table.add_row("Payslip Verification", status, details)
+    payslip = state.payslip_verification
+    if payslip:
+        details = [f"Confidence: {payslip.confidence_score:.2f}"]
+        if payslip.monthly_income:
+            details.append(f", Income: ${payslip.monthly_income:,.2f}")
+        rows.append(("Payslip Verification", "✅ VERIFIED" if payslip.verified else "❌ FAILED", "".join(details)))
     
     # Web References
-    if state.web_references:
-        status = "✅ FOUND" if state.web_references.verified else "❌ NOT FOUND"
-        details = f"Sources: {state.web_references.sources_found}"
-        if state.web_references.risk_flags:
-            details += f", Risk Flags: {len(state.web_references.risk_flags)}"
-        table.add_row("Web References", status, details)
+    web = state.web_references
+    if web:
+        details = [f"Sources: {web.sources_found}"]
+        if web.risk_flags:
+            details.append(f", Risk Flags: {len(web.risk_flags)}")
+        rows.append(("Web References", "✅ FOUND" if web.verified else "❌ NOT FOUND", "".join(details)))
     
     # Financial Reports
-    if state.financial_reports:
-        status = "✅ VERIFIED" if state.financial_reports.verified else "❌ FAILED"
-        details = f"Reports: {len(state.financial_reports.reports_analyzed)}"
-        table.add_row("Financial Reports", status, details)
+    financial = state.financial_reports
+    if financial:
+        rows.append((
+            "Financial Reports",
+            "✅ VERIFIED" if financial.verified else "❌ FAILED",
+            f"Reports: {len(financial.reports_analyzed)}",
+        ))
+    
+    table = Table(title="Verification Results", show_lines=False, expand=False, padding=(0, 1))
+    table.add_column("Component", style="cyan", no_wrap=True)
+    table.add_column("Status", style="green")
+    table.add_column("Details", style="white")
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     
@@ -192,15 +218,16 @@ def _display_results(state: SOWState):
                 console.print(f"• {rec}")
     
     # Human Review Status
-    if state.needs_human_review:
+    flags = state.flags
+    if flags & SOWFlag.NEEDS_REVIEW:
         console.print(f"\n[yellow]⚠️  Human review required[/yellow]")
-        if not state.human_review_completed:
+        if not flags & SOWFlag.REVIEW_DONE:
             console.print("Use 'sow-agent resume' command after human review is complete.")
     
     # Messages
     if state.messages:
         console.print("\n[bold]Process Messages:[/bold]")
-        for msg in state.messages[-5:]:  # Show last 5 messages
+        for msg in state.recent_messages:  # Show last 5 messages
             msg_color = "green" if msg["type"] == "success" else "yellow" if msg["type"] == "warning" else "red" if msg["type"] == "error" else "white"
             console.print(f"[{msg_color}]{msg['agent']}:[/{msg_color}] {msg['message']}")
 
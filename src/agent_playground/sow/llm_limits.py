@@ -0,0 +1,100 @@
+"""Process-wide limits on LLM calls made by the SOW agents."""
+
+import asyncio
+import os
+import time
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+
+def env_limit(name: str, default: float, kind: type = int) -> float:
+    """
+    Read a positive limit from the environment.
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+        kind: Type the value is parsed as, ``int`` or ``float``
+
+    Returns:
+        The parsed limit
+
+    Raises:
+        ValueError: If the variable is set to anything but a positive number of ``kind``
+    """
+    raw = os.environ.get(name)
+    if raw is None:
+        return kind(default)
+    try:
+        value = kind(raw)
+    except ValueError:
+        value = None
+    if value is None or not value > 0:
+        raise ValueError(f"{name} must be a positive {kind.__name__}, got {raw!r}")
+    return value
+
+
+def per_loop_semaphore(value: int) -> Callable[[], asyncio.Semaphore]:
+    """
+    Make a getter for a semaphore of ``value`` slots per event loop.
+
+    An asyncio.Semaphore binds to the loop it is first awaited on, so one is
+    created lazily for each running loop instead of once at import.
+    """
+    semaphores: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+
+    def get() -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = semaphores.get(loop)
+        if semaphore is None:
+            semaphore = semaphores[loop] = asyncio.Semaphore(value)
+        return semaphore
+
+    return get
+
+
+class AsyncLimiter:
+    """
+    Token-bucket rate limiter for asyncio code.
+
+    Allows bursts of up to ``rate`` acquisitions, refilled continuously at
+    ``rate`` per ``per`` seconds.
+    """
+
+    def __init__(self, rate: float, per: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Number of acquisitions allowed per period
+            per: Period length in seconds
+        """
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.per)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+    async def __aenter__(self) -> "AsyncLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+# Caps in-flight LLM requests across all agents on the running event loop
+llm_semaphore = per_loop_semaphore(env_limit("LLM_CONCURRENCY", 16))
+
+# Caps LLM requests per second across all agents
+LIMITER = AsyncLimiter(rate=env_limit("LLM_RATE_LIMIT", 10, float), per=1.0)
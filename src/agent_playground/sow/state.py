@@ -1,14 +1,97 @@
 """State management for Source of Wealth analysis."""
 
+from collections import deque
+from dataclasses import dataclass
+from enum import IntFlag
 from datetime import datetime
-from typing import Dict, List, Any, Optional, TypedDict, Annotated, Union
-from pydantic import BaseModel, Field
+from typing import Deque, Dict, List, Any, Optional, Set, Tuple, TypedDict, Annotated, Union
+from pydantic import BaseModel, Field, PrivateAttr
 from pathlib import Path
 import operator
+import time
 
 from ..core.base import AgentState
 
 
+# Number of messages kept in SOWState.recent_messages
+_RECENT_MESSAGES = 5
+
+# Most messages the workflow graph keeps in SOWState.messages
+MAX_MESSAGES = 1000
+
+
+class SOWFlag(IntFlag):
+    """Workflow control flags packed from SOWState fields."""
+    NEEDS_REVIEW = 1
+    REVIEW_DONE = 2
+    COMPLETED = 4
+
+
+# Steps counted towards workflow progress
+_SOW_TOTAL_STEPS = frozenset((
+    "id_verification",
+    "payslip_verification",
+    "web_references",
+    "financial_reports",
+    "risk_assessment",
+    "corroboration",
+    "report_generation",
+))
+
+
+# SOWDocuments fields, in declaration order
+_SOW_DOC_FIELDS = (
+    "id_document",
+    "payslip",
+    "bank_statement",
+    "employment_letter",
+    "tax_document",
+)
+
+# Legacy state key for each SOWDocuments field
+_SOW_DOC_PATH_KEYS = (
+    ("id_document", "id_document_path"),
+    ("payslip", "payslip_document_path"),
+    ("bank_statement", "bank_statement_path"),
+    ("employment_letter", "employment_letter_path"),
+    ("tax_document", "tax_document_path"),
+)
+
+
+def new_message(agent: str, message: str, message_type: str = "info") -> Dict[str, Any]:
+    """Build a state message entry stamped with the current time."""
+    return {
+        "agent": agent,
+        "message": message,
+        "type": message_type,
+        "ts_ns": time.time_ns()
+    }
+
+
+def append_messages(left: List[Dict[str, Any]], right: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Graph reducer appending new messages while capping the history.
+    
+    Once more than ``MAX_MESSAGES`` would be kept, the oldest ones are dropped
+    and a single "history truncated" message leads the list instead.
+    """
+    messages = left + right
+    if len(messages) <= MAX_MESSAGES:
+        return messages
+    return [
+        new_message("workflow", "Message history truncated", "info"),
+        *messages[len(messages) - MAX_MESSAGES + 1:],
+    ]
+
+
+def message_timestamp(message: Dict[str, Any]) -> str:
+    """Format a state message's ``ts_ns`` timestamp as local ISO-8601."""
+    if "ts_ns" in message:
+        return datetime.fromtimestamp(message["ts_ns"] / 1e9).isoformat()
+    # Messages recorded before timestamps were stored as integers
+    return message.get("timestamp", "")
+
+
 class VerificationResult(BaseModel):
     """Base verification result."""
     verified: bool = False
@@ -70,7 +153,8 @@ class CorroborationResult(BaseModel):
     analysis: str = ""
 
 
-class SOWDocuments(BaseModel):
+@dataclass(slots=True)
+class SOWDocuments:
     """Document collection for SOW verification."""
     id_document: Optional[Path] = None
     payslip: Optional[Path] = None
@@ -78,17 +162,64 @@ class SOWDocuments(BaseModel):
     employment_letter: Optional[Path] = None
     tax_document: Optional[Path] = None
     
+    def __post_init__(self):
+        """Coerce string paths to ``Path``."""
+        for field in _SOW_DOC_FIELDS:
+            value = getattr(self, field)
+            if value is not None and not isinstance(value, Path):
+                setattr(self, field, Path(value))
+    
     def to_paths_dict(self) -> Dict[str, Optional[str]]:
         """Convert to dictionary of string paths for compatibility."""
         return {
-            'id_document_path': str(self.id_document) if self.id_document else None,
-            'payslip_document_path': str(self.payslip) if self.payslip else None,
-            'bank_statement_path': str(self.bank_statement) if self.bank_statement else None,
-            'employment_letter_path': str(self.employment_letter) if self.employment_letter else None,
-            'tax_document_path': str(self.tax_document) if self.tax_document else None,
+            key: str(path) if (path := getattr(self, field)) else None
+            for field, key in _SOW_DOC_PATH_KEYS
         }
 
 
+def _fmt_id(result: IDVerificationResult) -> str:
+    """Summary lines for ID verification."""
+    text = f"ID Verification: {'VERIFIED' if result.verified else 'FAILED'}"
+    if result.issues_found:
+        text += f"\nID Issues: {', '.join(result.issues_found)}"
+    return text
+
+
+def _fmt_pay(result: PayslipVerificationResult) -> str:
+    """Summary lines for payslip verification."""
+    text = f"Payslip Verification: {'VERIFIED' if result.verified else 'FAILED'}"
+    if result.monthly_income:
+        text += f"\nMonthly Income: ${result.monthly_income:,.2f}"
+    if result.employer:
+        text += f"\nEmployer: {result.employer}"
+    return text
+
+
+def _fmt_web(result: WebReferenceResult) -> str:
+    """Summary lines for web references."""
+    text = f"Web References: {'FOUND' if result.verified else 'NOT_FOUND'}"
+    if result.risk_flags:
+        text += f"\nWeb Risk Flags: {', '.join(result.risk_flags)}"
+    return text
+
+
+def _fmt_fin(result: FinancialReportResult) -> str:
+    """Summary lines for financial reports."""
+    text = f"Financial Reports: {'VERIFIED' if result.verified else 'FAILED'}"
+    if result.annual_income_range:
+        text += f"\nAnnual Income Range: {result.annual_income_range}"
+    return text
+
+
+# Verification summary sections, in output order
+_SECTIONS = (
+    ("id_verification", _fmt_id),
+    ("payslip_verification", _fmt_pay),
+    ("web_references", _fmt_web),
+    ("financial_reports", _fmt_fin),
+)
+
+
 class SOWState(AgentState):
     """State for Source of Wealth analysis workflow."""
     
@@ -120,37 +251,102 @@ class SOWState(AgentState):
     final_report: Optional[str] = None
     summary: Optional[str] = None
     
+    # Memory-mapped document contents keyed by path, shared by all agents for
+    # the duration of a run and never serialized
+    documents: Dict[str, Any] = Field(default_factory=dict, exclude=True)
+    
+    # Checkpoint thread of the workflow run, used to resume after human review
+    thread_id: Optional[str] = None
+    
     # Messages for agent communication
-    messages: Annotated[List[Dict[str, Any]], operator.add] = Field(default_factory=list)
+    messages: Annotated[List[Dict[str, Any]], append_messages] = Field(default_factory=list)
     
     # Progress tracking
     completed_steps: Annotated[List[str], operator.add] = Field(default_factory=list)
     current_step: str = "initialization"
     
+    # Verification results the cached summary was built from, and the summary
+    _summary_cache: Optional[Tuple[Tuple[Any, ...], str]] = PrivateAttr(default=None)
+    
+    # Set mirror of completed_steps, with the list object and length it was built from
+    _completed_set: Set[str] = PrivateAttr(default_factory=set)
+    _completed_src: Tuple[Any, int] = PrivateAttr(default=(None, 0))
+    
+    # Ring buffer of the latest messages, with the list object and length it mirrors
+    _recent: Deque[Dict[str, Any]] = PrivateAttr(default_factory=lambda: deque(maxlen=_RECENT_MESSAGES))
+    _recent_src: Tuple[Any, int] = PrivateAttr(default=(None, 0))
+    
     def add_message(self, agent: str, message: str, message_type: str = "info"):
         """Add a message to the state."""
-        self.messages.append({
-            "agent": agent,
-            "message": message,
-            "type": message_type,
-            "timestamp": datetime.now().isoformat()
-        })
+        entry = new_message(agent, message, message_type)
+        messages = self.messages
+        src_list, src_len = self._recent_src
+        in_sync = src_list is messages and src_len == len(messages)
+        messages.append(entry)
+        if in_sync:
+            self._recent.append(entry)
+            self._recent_src = (messages, len(messages))
+    
+    @property
+    def recent_messages(self) -> Deque[Dict[str, Any]]:
+        """The last few messages, kept in a bounded deque."""
+        messages = self.messages
+        src_list, src_len = self._recent_src
+        if src_list is not messages or src_len != len(messages):
+            # The list was replaced or extended outside add_message
+            self._recent = deque(messages[-_RECENT_MESSAGES:], maxlen=_RECENT_MESSAGES)
+            self._recent_src = (messages, len(messages))
+        return self._recent
+    
+    def _add_completed_step(self, step: str):
+        """Append a step once, using a set mirror instead of scanning the list."""
+        steps = self.completed_steps
+        src_list, src_len = self._completed_src
+        if src_list is not steps or src_len != len(steps):
+            # The list was replaced or changed outside these helpers
+            self._completed_set = set(steps)
+        if step not in self._completed_set:
+            steps.append(step)
+            self._completed_set.add(step)
+        self._completed_src = (steps, len(steps))
     
     def mark_step_completed(self, step: str):
         """Mark a workflow step as completed."""
-        if step not in self.completed_steps:
-            self.completed_steps.append(step)
+        self._add_completed_step(step)
+    
+    def complete_step(self, step: str, agent: str, message: str, message_type: str = "info"):
+        """Mark a workflow step as completed and record the agent's message."""
+        self._add_completed_step(step)
+        self.add_message(agent, message, message_type)
+    
+    @property
+    def flags(self) -> SOWFlag:
+        """Workflow control state as a single bitmask."""
+        return (
+            (SOWFlag.NEEDS_REVIEW if self.needs_human_review else SOWFlag(0))
+            | (SOWFlag.REVIEW_DONE if self.human_review_completed else SOWFlag(0))
+            | (SOWFlag.COMPLETED if self.completed else SOWFlag(0))
+        )
     
     def get_progress_percentage(self) -> float:
         """Calculate workflow progress percentage."""
-        total_steps = [
-            "id_verification",
-            "payslip_verification", 
-            "web_references",
-            "financial_reports",
-            "risk_assessment",
-            "corroboration",
-            "report_generation"
-        ]
-        completed = len([s for s in total_steps if s in self.completed_steps])
-        return (completed / len(total_steps)) * 100
+        completed = len(_SOW_TOTAL_STEPS.intersection(self.completed_steps))
+        return (completed / len(_SOW_TOTAL_STEPS)) * 100
+    
+    @property
+    def verification_summary(self) -> str:
+        """Plain-text summary of verification results, rebuilt only when a result is replaced."""
+        results = (self.id_verification, self.payslip_verification, self.web_references, self.financial_reports)
+        cached = self._summary_cache
+        if cached is not None and all(old is new for old, new in zip(cached[0], results)):
+            return cached[1]
+        summary = self._build_verification_summary()
+        self._summary_cache = (results, summary)
+        return summary
+    
+    def _build_verification_summary(self) -> str:
+        """Compile summary of all verification results."""
+        return "\n".join(
+            fmt(result) for attr, fmt in _SECTIONS
+            if (result := getattr(self, attr))
+        )
@@ -1,21 +1,100 @@
 """Source of Wealth analysis workflow implementation."""
 
-from typing import Dict, Any, Optional, List
-from langgraph.graph import StateGraph, END
+import mmap
+import time
+import uuid
+from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Any, Optional, List
 
-from ..workflows.builder import WorkflowBuilder
 from ..utils.logging import get_logger
-from .state import SOWState
-from .agents import (
-    IDVerificationAgent,
-    PayslipVerificationAgent,
-    WebReferencesAgent,
-    FinancialReportsAgent,
-    RiskAssessmentAgent,
-    ReportGenerationAgent,
-    HumanAdvisoryAgent,
+from .agent_cache import AGENT_CACHE, cache_key, file_digest
+from .state import SOWFlag, SOWState, new_message
+
+if TYPE_CHECKING:
+    from langchain_core.runnables import RunnableConfig
+    from langgraph.graph import StateGraph
+    from ..workflows.builder import WorkflowBuilder
+
+
+# Verification agents are independent: each reads its own document and writes
+# a disjoint result slot on the state, so they run as parallel graph branches.
+VERIFICATION_STEPS = (
+    "id_verification",
+    "payslip_verification",
+    "web_references",
+    "financial_reports",
+)
+
+# Steps run one after another once every verification has finished
+ANALYSIS_STEPS = (
+    "risk_assessment",
+    "human_advisory",
 )
 
+DEFAULT_VERIFICATION_CONCURRENCY = 4
+
+# Timestamp fields of the result models, restamped when a result is replayed
+# from the cache and left out of the inputs cached results are keyed on
+_RESULT_DATE_FIELDS = frozenset(("verification_date", "assessment_date", "corroboration_date"))
+
+# State inputs each cacheable step depends on; a repeat run with the same
+# inputs and agent configuration reuses the step's earlier state update
+# instead of calling the agent again.
+_CACHE_INPUTS: Dict[str, Callable[[SOWState], tuple]] = {
+    "id_verification": lambda s: (
+        s.client_id, s.client_name, _document_digest(s, s.id_document_path)
+    ),
+    "payslip_verification": lambda s: (
+        s.client_id, s.client_name, _document_digest(s, s.payslip_document_path)
+    ),
+    "web_references": lambda s: (s.client_id, s.client_name),
+    "financial_reports": lambda s: (
+        s.client_id, tuple(_document_digest(s, path) for path in s.financial_report_paths)
+    ),
+    "risk_assessment": lambda s: (
+        s.client_id,
+        s.client_name,
+        tuple(
+            result.model_dump_json(exclude=_RESULT_DATE_FIELDS) if result else None
+            for result in (s.id_verification, s.payslip_verification, s.web_references, s.financial_reports)
+        ),
+    ),
+}
+
+
+def _document_digest(state: SOWState, path: Optional[str]) -> str:
+    """Hash a document, reusing its mapping from the state when there is one."""
+    return file_digest(path, state.documents.get(path))
+
+
+def _map_documents(paths: List[Optional[str]]) -> Dict[str, memoryview]:
+    """Memory-map each readable, non-empty document once for the whole run."""
+    documents = {}
+    for path in paths:
+        if not path or path in documents:
+            continue
+        try:
+            with open(path, "rb") as f:
+                documents[path] = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):
+            # Missing and empty files are reported by the agents themselves
+            continue
+    return documents
+
+
+def _close_documents(documents: Dict[str, memoryview]) -> None:
+    """Release the views created by ``_map_documents`` and unmap the files."""
+    for view in documents.values():
+        mapped = view.obj
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # An agent still holds a view; the mapping is freed with it
+            pass
+    documents.clear()
+
 
 class SOWWorkflow:
     """Source of Wealth analysis workflow."""
@@ -29,6 +108,17 @@ class SOWWorkflow:
     
     def _setup_agents(self):
         """Initialize all SOW agents."""
+        # Agent modules pull in the LLM clients, so load them only when needed
+        from .agents import (
+            IDVerificationAgent,
+            PayslipVerificationAgent,
+            WebReferencesAgent,
+            FinancialReportsAgent,
+            RiskAssessmentAgent,
+            ReportGenerationAgent,
+            HumanAdvisoryAgent,
+        )
+        
         self.agents = {
             "id_verification": IDVerificationAgent(),
             "payslip_verification": PayslipVerificationAgent(),
@@ -39,25 +129,38 @@ class SOWWorkflow:
             "report_generation": ReportGenerationAgent(),
         }
     
-    def build_graph(self) -> StateGraph:
+    @cached_property
+    def compiled_graph(self):
+        """
+        Compiled LangGraph workflow, built on first use and reused across runs.
+        
+        Runs are checkpointed per thread so a run paused for human review can
+        be resumed through the graph. A thread's checkpoints are deleted once
+        its run finishes without pausing, or once it has been resumed.
+        """
+        from langgraph.checkpoint.memory import InMemorySaver
+        
+        return self.build_graph().compile(checkpointer=InMemorySaver())
+    
+    def build_graph(self) -> "StateGraph":
         """Build the LangGraph workflow."""
-        workflow = StateGraph(SOWState)
+        from langgraph.graph import StateGraph, START, END
         
-        # Add all agent nodes
-        for agent_name, agent in self.agents.items():
-            workflow.add_node(agent_name, agent.process)
+        workflow = StateGraph(SOWState)
         
-        # Define the workflow flow
-        workflow.set_entry_point("id_verification")
+        # Verification phase: fan out from the start
+        for step in VERIFICATION_STEPS:
+            workflow.add_node(step, self._as_node(step))
+            workflow.add_edge(START, step)
         
-        # Parallel verification phase
-        workflow.add_edge("id_verification", "payslip_verification")
-        workflow.add_edge("payslip_verification", "web_references")
-        workflow.add_edge("web_references", "financial_reports")
+        # Analysis phase: nodes and their chaining edge in a single call
+        workflow.add_sequence([
+            (step, self._as_node(step)) for step in ANALYSIS_STEPS
+        ])
+        workflow.add_node("report_generation", self._as_node("report_generation"))
         
-        # Analysis phase
-        workflow.add_edge("financial_reports", "risk_assessment")
-        workflow.add_edge("risk_assessment", "human_advisory")
+        # Join the verification branches before risk assessment
+        workflow.add_edge(list(VERIFICATION_STEPS), ANALYSIS_STEPS[0])
         
         # Conditional routing based on human review
         workflow.add_conditional_edges(
@@ -73,9 +176,87 @@ class SOWWorkflow:
         
         return workflow
     
+    def _as_node(self, step: str) -> Callable[[SOWState, "RunnableConfig"], Awaitable[Dict[str, Any]]]:
+        """
+        Wrap an agent as a graph node returning only the state it changed.
+        
+        The agent runs on a shallow copy of the state with its own message and
+        step lists, so parallel branches never share mutable lists; the node
+        returns the new list entries and any replaced fields, which the state
+        reducers merge. A failing verification step is logged and recorded as
+        an error message instead of aborting its sibling branches.
+        
+        Updates of steps listed in ``_CACHE_INPUTS`` are cached on the step's
+        inputs, the agent's config and the workflow config, unless the
+        workflow config sets ``agent_cache`` to False. Messages replayed from
+        the cache, and the dates of replayed results, are stamped with the
+        current time.
+        
+        Mapped documents arrive through the run config rather than the graph
+        state, so they are never checkpointed.
+        """
+        agent = self.agents[step]
+        isolate = step in VERIFICATION_STEPS
+        cache_inputs = _CACHE_INPUTS.get(step) if self.config.get("agent_cache", True) else None
+        
+        async def node(state: SOWState, config: "RunnableConfig") -> Dict[str, Any]:
+            documents = config.get("configurable", {}).get("documents")
+            if documents:
+                state = state.model_copy(update={"documents": documents})
+            
+            key = None
+            if cache_inputs is not None:
+                key = cache_key(
+                    step,
+                    type(agent).__qualname__,
+                    agent.config.model_dump(),
+                    self.config,
+                    cache_inputs(state),
+                )
+                cached = AGENT_CACHE.get(key)
+                if cached is not None:
+                    self.logger.debug("Reusing cached result for {}", step)
+                    for message in cached["messages"]:
+                        message["ts_ns"] = time.time_ns()
+                    now = datetime.now()
+                    for value in cached.values():
+                        for field in _RESULT_DATE_FIELDS & getattr(type(value), "model_fields", {}).keys():
+                            setattr(value, field, now)
+                    return cached
+            
+            branch = state.model_copy(update={
+                "messages": list(state.messages),
+                "completed_steps": list(state.completed_steps),
+            })
+            try:
+                result = await agent.process(branch)
+            except Exception as e:
+                if not isolate:
+                    raise
+                self.logger.error("Verification step {} failed: {}", step, e)
+                branch.add_message(
+                    agent="workflow",
+                    message=f"{step} failed: {str(e)}",
+                    message_type="error"
+                )
+                result = branch
+            
+            update = {
+                name: value for name, value in result
+                if name != "documents" and value is not getattr(state, name)
+            }
+            update["messages"] = result.messages[len(state.messages):]
+            update["completed_steps"] = result.completed_steps[len(state.completed_steps):]
+            # Failed steps are retried on the next run rather than cached
+            if key is not None and not any(m["type"] == "error" for m in update["messages"]):
+                AGENT_CACHE.put(key, update)
+            return update
+        
+        return node
+    
     def _should_continue_to_report(self, state: SOWState) -> str:
         """Determine if workflow should continue to report generation."""
-        if state.needs_human_review and not state.human_review_completed:
+        if state.flags & (SOWFlag.NEEDS_REVIEW | SOWFlag.REVIEW_DONE) == SOWFlag.NEEDS_REVIEW:
             return "human_review"
         return "continue"
     
@@ -100,21 +281,37 @@ class SOWWorkflow:
             **kwargs
         )
         
-        self.logger.info(f"Starting SOW workflow for client: {client_name} (ID: {client_id})")
+        # Each run gets its own checkpoint thread
+        initial_state.thread_id = f"{client_id}:{uuid.uuid4().hex}"
+        
+        # Map each document once; agent nodes read it from the run config
+        documents = _map_documents([
+            initial_state.id_document_path,
+            initial_state.payslip_document_path,
+            *initial_state.financial_report_paths,
+        ])
         
-        # Build and compile the graph
-        graph = self.build_graph()
-        compiled_graph = graph.compile()
+        self.logger.info("Starting SOW workflow for client: {} (ID: {})", client_name, client_id)
         
         # Run the workflow
+        paused = False
         try:
-            result = await compiled_graph.ainvoke(initial_state)
+            result = await self.compiled_graph.ainvoke(
+                initial_state,
+                {
+                    "configurable": {"thread_id": initial_state.thread_id, "documents": documents},
+                    "max_concurrency": self.config.get(
+                        "verification_concurrency", DEFAULT_VERIFICATION_CONCURRENCY
+                    ),
+                }
+            )
+            paused = result.get("needs_human_review", False) and not result.get("human_review_completed", False)
             
-            self.logger.info(f"SOW workflow completed for client: {client_name}")
+            self.logger.info("SOW workflow completed for client: {}", client_name)
             return result
             
         except Exception as e:
-            self.logger.error(f"Error in SOW workflow: {str(e)}")
+            self.logger.error("Error in SOW workflow: {}", e)
             # Return state with error information
             initial_state.add_message(
                 agent="workflow",
@@ -122,6 +319,12 @@ class SOWWorkflow:
                 message_type="error"
             )
             return initial_state
+        
+        finally:
+            _close_documents(documents)
+            # Only a run paused for human review is resumed from its checkpoints
+            if not paused and "compiled_graph" in self.__dict__:
+                await self.compiled_graph.checkpointer.adelete_thread(initial_state.thread_id)
     
     async def resume_after_human_review(
         self,
@@ -129,26 +332,42 @@ class SOWWorkflow:
         human_feedback: Optional[str] = None
     ) -> SOWState:
         """Resume workflow after human review."""
+        thread = {"configurable": {"thread_id": state.thread_id}}
+        paused = state.thread_id and (await self.compiled_graph.aget_state(thread)).values
         
-        # Update state with human feedback
-        state.human_review_completed = True
-        if human_feedback:
-            state.human_feedback = human_feedback
-            state.add_message(
-                agent="human_reviewer",
-                message=f"Human review completed: {human_feedback}",
-                message_type="info"
-            )
-        
-        # Continue with report generation
-        report_agent = self.agents["report_generation"]
-        final_state = await report_agent.process(state)
+        if not paused:
+            # No checkpoint for this state (e.g. built outside run()): run the report directly
+            state.human_review_completed = True
+            if human_feedback:
+                state.human_feedback = human_feedback
+                state.add_message(
+                    agent="human_reviewer",
+                    message=f"Human review completed: {human_feedback}",
+                    message_type="info"
+                )
+            final_state = await self.agents["report_generation"].process(state)
+        else:
+            # Record the review as if human_advisory produced it, so its
+            # routing now continues to report generation
+            review: Dict[str, Any] = {"human_review_completed": True}
+            if human_feedback:
+                review["human_feedback"] = human_feedback
+                review["messages"] = [new_message(
+                    agent="human_reviewer",
+                    message=f"Human review completed: {human_feedback}",
+                    message_type="info"
+                )]
+            await self.compiled_graph.aupdate_state(thread, review, as_node="human_advisory")
+            # The graph returns its channel values; hand back a state like the direct path
+            final_state = SOWState.model_validate(await self.compiled_graph.ainvoke(None, thread))
+            await self.compiled_graph.checkpointer.adelete_thread(state.thread_id)
         
-        self.logger.info(f"SOW workflow resumed and completed for client: {state.client_name}")
+        self.logger.info("SOW workflow resumed and completed for client: {}", state.client_name)
         return final_state
     
     def get_workflow_status(self, state: SOWState) -> Dict[str, Any]:
         """Get current workflow status."""
+        risk = state.risk_assessment
         return {
             "client_id": state.client_id,
             "client_name": state.client_name,
@@ -157,8 +376,8 @@ class SOWWorkflow:
             "completed_steps": state.completed_steps,
             "needs_human_review": state.needs_human_review,
             "human_review_completed": state.human_review_completed,
-            "risk_level": state.risk_assessment.risk_level if state.risk_assessment else None,
-            "risk_score": state.risk_assessment.risk_score if state.risk_assessment else None,
+            "risk_level": risk.risk_level if risk else None,
+            "risk_score": risk.risk_score if risk else None,
         }
 
 
@@ -168,8 +387,19 @@ def create_sow_workflow(config: Optional[Dict[str, Any]] = None) -> SOWWorkflow:
 
 
 # Alternative builder pattern approach
-def build_sow_workflow_with_builder() -> WorkflowBuilder:
-    """Build SOW workflow using the WorkflowBuilder."""
+@lru_cache(maxsize=1)
+def build_sow_workflow_with_builder() -> "WorkflowBuilder":
+    """Build SOW workflow using the WorkflowBuilder (built once and shared)."""
+    from ..workflows.builder import WorkflowBuilder
+    from .agents import (
+        IDVerificationAgent,
+        PayslipVerificationAgent,
+        WebReferencesAgent,
+        FinancialReportsAgent,
+        RiskAssessmentAgent,
+        ReportGenerationAgent,
+        HumanAdvisoryAgent,
+    )
     
     # Create agents
     id_agent = IDVerificationAgent()
@@ -1,7 +1,8 @@
 """Utility modules for Agent Playground."""
 
 from .config import get_settings, get_env_info, Settings
-from .logging import setup_logging, get_logger, log_agent_execution, log_workflow_step, log_error, LoggingMixin
+from .serialization import json_loads, json_dumps, find_json_object, JSONDecodeError
+from .logging import setup_logging, get_logger, is_level_enabled, log_agent_execution, log_workflow_step, log_error, LoggingMixin
 
 __all__ = [
     # Configuration
@@ -11,8 +12,14 @@ __all__ = [
     # Logging
     "setup_logging",
     "get_logger",
+    "is_level_enabled",
     "log_agent_execution",
     "log_workflow_step", 
     "log_error",
     "LoggingMixin",
+    # Serialization
+    "json_loads",
+    "json_dumps",
+    "find_json_object",
+    "JSONDecodeError",
 ]
@@ -2,9 +2,10 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
+from dotenv import dotenv_values
 from functools import lru_cache
 
 
@@ -119,13 +120,6 @@ class Settings(BaseSettings):
             return Path(v)
         return v
     
-    def model_post_init(self, __context: Any) -> None:
-        """Create directories if they don't exist."""
-        for dir_attr in ["data_dir", "reports_dir", "memory_bank_dir"]:
-            dir_path = getattr(self, dir_attr)
-            if not dir_path.exists():
-                dir_path.mkdir(parents=True, exist_ok=True)
-    
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
@@ -133,33 +127,110 @@ class Settings(BaseSettings):
     }
 
 
+# Env file locations, in lookup order
+_ENV_FILES = (
+    Path(".env"),
+    Path("env/.env"),
+    Path("config/.env"),
+)
+
+
+def _probe_env_files() -> Tuple[bool, ...]:
+    """
+    Check which of ``_ENV_FILES`` exist.
+    
+    Scans the working directory once and only looks inside the ``env`` and
+    ``config`` subdirectories when they are present. Not cached: ``get_settings``
+    caches the settings built from the result, and ``get_env_info`` reports
+    the files as they are now.
+    
+    Returns:
+        Existence flag for each entry of ``_ENV_FILES``
+    """
+    with os.scandir(".") as entries:
+        found = {entry.name: entry for entry in entries}
+    
+    def exists(path: Path) -> bool:
+        entry = found.get(path.parts[0])
+        if entry is None:
+            return False
+        if len(path.parts) == 1:
+            return entry.is_file()
+        return entry.is_dir() and path.is_file()
+    
+    return tuple(exists(path) for path in _ENV_FILES)
+
+
+# Settings fields holding sub-configurations, built from the shared env values
+_SUB_CONFIGS = {
+    "model": ModelConfig,
+    "tracing": TracingConfig,
+    "agent": AgentConfig,
+    "logging": LoggingConfig,
+}
+
+
+def _read_env_file(env_file: Optional[str]) -> Dict[str, str]:
+    """
+    Parse an env file once for all configuration models.
+    
+    Variables already set in the process environment take precedence, as
+    they do when each model reads the file itself.
+    
+    Args:
+        env_file: Path to environment file, or None
+        
+    Returns:
+        Lower-cased variable names mapped to values
+    """
+    if env_file is None:
+        return {}
+    environ = {name.lower() for name in os.environ}
+    return {
+        name.lower(): value
+        for name, value in dotenv_values(env_file).items()
+        if value is not None and name.lower() not in environ
+    }
+
+
+def _build_settings(env_file: Optional[str]) -> Settings:
+    """Build settings and sub-configurations from a single env file parse."""
+    values = _read_env_file(env_file)
+    sub_configs = {
+        name: config_cls(_env_file=None, **values)
+        for name, config_cls in _SUB_CONFIGS.items()
+    }
+    top_level = {name: value for name, value in values.items() if name not in _SUB_CONFIGS}
+    return Settings(_env_file=None, **top_level, **sub_configs)
+
+
 @lru_cache()
 def get_settings(env_file: Optional[str] = None) -> Settings:
     """
     Get cached application settings.
     
+    Data directories are created here, once per process, rather than on
+    every Settings construction.
+    
     Args:
         env_file: Optional path to environment file
         
     Returns:
         Settings instance
     """
-    if env_file:
-        return Settings(_env_file=env_file)
+    if not env_file:
+        # Try multiple env file locations, falling back to environment variables only
+        env_file = next(
+            (str(path) for path, exists in zip(_ENV_FILES, _probe_env_files()) if exists),
+            None
+        )
     
-    # Try multiple env file locations
-    env_files = [
-        Path(".env"),
-        Path("env/.env"),
-        Path("config/.env"),
-    ]
+    settings = _build_settings(env_file)
     
-    for env_file_path in env_files:
-        if env_file_path.exists():
-            return Settings(_env_file=str(env_file_path))
+    for dir_path in (settings.data_dir, settings.reports_dir, settings.memory_bank_dir):
+        dir_path.mkdir(parents=True, exist_ok=True)
     
-    # Fall back to environment variables only
-    return Settings()
+    return settings
 
 
 def get_env_info() -> Dict[str, Any]:
@@ -173,14 +244,6 @@ def get_env_info() -> Dict[str, Any]:
         "app_version": settings.app_version,
         "python_version": os.sys.version,
         "working_directory": os.getcwd(),
-        "env_files_checked": [
-            str(Path(".env").absolute()),
-            str(Path("env/.env").absolute()),
-            str(Path("config/.env").absolute()),
-        ],
-        "env_files_exist": [
-            Path(".env").exists(),
-            Path("env/.env").exists(), 
-            Path("config/.env").exists(),
-        ],
+        "env_files_checked": [str(path.absolute()) for path in _ENV_FILES],
+        "env_files_exist": list(_probe_env_files()),
     }
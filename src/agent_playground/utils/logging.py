@@ -1,78 +1,132 @@
 """Logging utilities for Agent Playground."""
 
+import os
+import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from loguru import logger
 from .config import get_settings, LoggingConfig
 
 
+# Bound loggers by name, shared by every get_logger caller
+_LOGGER_CACHE: Dict[str, Any] = {}
+
+# Ids of the sinks installed by setup_logging; None until its first call, when
+# loguru's default stderr sink is still in place
+_SINK_IDS: Optional[List[int]] = None
+
+# Lowest level number accepted by those sinks; until setup_logging runs,
+# loguru's default sink accepts DEBUG and above
+_MIN_LEVEL_NO: int = logger.level("DEBUG").no
+
+# Console format strings, with loguru color markup
+_JSON_FORMAT = "{time} | {level} | {name}:{function}:{line} | {message}"
+_DETAILED_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
+    "<level>{message}</level>"
+)
+_SIMPLE_FORMAT = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+
+# Format string and serialize flag per LoggingConfig.log_format
+_FORMATS: Dict[str, Tuple[str, bool]] = {
+    "json": (_JSON_FORMAT, True),
+    "detailed": (_DETAILED_FORMAT, False),
+    "simple": (_SIMPLE_FORMAT, False),
+}
+
+# The same formats without color markup, for sinks that are not terminals
+_COLOR_TAG_RE = re.compile(r"</?(?:green|cyan|level)>")
+_PLAIN_FORMATS = {
+    name: _COLOR_TAG_RE.sub("", format_string)
+    for name, (format_string, _) in _FORMATS.items()
+}
+
+
+# Log method and message template per workflow step status. Messages are
+# templates filled in by loguru from the record's extra data, and only once a
+# sink accepts the level.
+_STEP_LOGGERS = {
+    "failed": (logger.error, "Workflow step failed: {step}"),
+    "completed": (logger.info, "Workflow step completed: {step}"),
+}
+_DEFAULT_STEP_LOGGER = (logger.debug, "Workflow step {status}: {step}")
+
+
 def setup_logging(config: Optional[LoggingConfig] = None) -> None:
     """
     Set up logging configuration using loguru.
     
+    Calling it again replaces the sinks added by the previous call; sinks
+    added elsewhere are left in place.
+    
+    Application settings are only loaded when no config is given, since that
+    also creates the data directories; otherwise the environment name is read
+    from the ``ENVIRONMENT`` variable.
+    
     Args:
         config: Optional logging configuration. If None, uses settings from config.
     """
+    global _SINK_IDS, _MIN_LEVEL_NO
+    
     if config is None:
         settings = get_settings()
         config = settings.logging
+        environment = settings.environment
+    else:
+        environment = os.environ.get("ENVIRONMENT", "development")
     
-    # Remove default logger
-    logger.remove()
+    # Remove the default logger on first use, our own sinks afterwards
+    if _SINK_IDS is None:
+        _SINK_IDS = []
+        try:
+            logger.remove(0)
+        except ValueError:
+            pass
+    while _SINK_IDS:
+        logger.remove(_SINK_IDS.pop())
     
     # Configure format based on config
-    if config.log_format == "json":
-        format_string = "{time} | {level} | {name}:{function}:{line} | {message}"
-        serialize = True
-    elif config.log_format == "detailed":
-        format_string = (
-            "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-            "<level>{level: <8}</level> | "
-            "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> | "
-            "<level>{message}</level>"
-        )
-        serialize = False
-    else:  # simple
-        format_string = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
-        serialize = False
+    log_format = config.log_format if config.log_format in _FORMATS else "simple"
+    format_string, serialize = _FORMATS[log_format]
+    
+    # Only a terminal renders colors; elsewhere skip the markup entirely
+    colorize = not serialize and sys.stderr.isatty()
+    plain_format = _PLAIN_FORMATS[log_format]
+    
+    # Variable values in tracebacks are costly to render and may leak data
+    debug_tracebacks = environment != "production"
+    
+    # Both sinks share the configured level
+    _MIN_LEVEL_NO = logger.level(config.log_level).no
     
     # Add console handler
-    logger.add(
+    _SINK_IDS.append(logger.add(
         sys.stderr,
-        format=format_string,
+        format=format_string if colorize else plain_format,
         level=config.log_level,
-        colorize=not serialize,
+        colorize=colorize,
         serialize=serialize,
-    )
+        backtrace=debug_tracebacks,
+        diagnose=debug_tracebacks,
+    ))
     
     # Add file handler if specified
     if config.log_file:
         log_file_path = Path(config.log_file)
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        logger.add(
+        _SINK_IDS.append(logger.add(
             str(log_file_path),
-            format=format_string,
+            format=plain_format,
             level=config.log_level,
             rotation=config.log_rotation,
             retention=config.log_retention,
             serialize=serialize,
             enqueue=True,  # Thread-safe logging
-        )
-    
-    # Set up structured logging
-    logger.configure(
-        handlers=[
-            {
-                "sink": sys.stderr,
-                "format": format_string,
-                "level": config.log_level,
-                "colorize": not serialize,
-                "serialize": serialize,
-            }
-        ]
-    )
+        ))
 
 
 def get_logger(name: str) -> "logger":
@@ -85,7 +139,27 @@ def get_logger(name: str) -> "logger":
     Returns:
         Logger instance
     """
-    return logger.bind(name=name)
+    bound = _LOGGER_CACHE.get(name)
+    if bound is None:
+        bound = _LOGGER_CACHE[name] = logger.bind(name=name)
+    return bound
+
+
+def is_level_enabled(level: str) -> bool:
+    """
+    Check whether a record at the given level would reach any sink.
+    
+    Useful to skip building expensive structured-log payloads that would be
+    discarded anyway. Only the sinks managed by ``setup_logging`` (or loguru's
+    default sink before it runs) are considered.
+    
+    Args:
+        level: Level name (e.g. "DEBUG", "INFO")
+        
+    Returns:
+        True if at least one configured sink accepts the level
+    """
+    return logger.level(level).no >= _MIN_LEVEL_NO
 
 
 def log_agent_execution(
@@ -112,7 +186,7 @@ def log_agent_execution(
     if duration is not None:
         log_data["duration_seconds"] = duration
     
-    logger.info(f"Agent execution: {action}", **log_data)
+    logger.info("Agent execution: {action}", **log_data)
 
 
 def log_workflow_step(
@@ -137,12 +211,8 @@ def log_workflow_step(
         **kwargs
     }
     
-    if status == "failed":
-        logger.error(f"Workflow step failed: {step_name}", **log_data)
-    elif status == "completed":
-        logger.info(f"Workflow step completed: {step_name}", **log_data)
-    else:
-        logger.debug(f"Workflow step {status}: {step_name}", **log_data)
+    log, message = _STEP_LOGGERS.get(status, _DEFAULT_STEP_LOGGER)
+    log(message, **log_data)
 
 
 def log_error(
@@ -165,7 +235,7 @@ def log_error(
         **kwargs
     }
     
-    logger.error(f"Error in {context}: {error}", **log_data)
+    logger.error("Error in {context}: {error_message}", **log_data)
 
 
 class LoggingMixin:
@@ -173,12 +243,17 @@ class LoggingMixin:
     
     @property
     def logger(self) -> "logger":
-        """Get a logger instance for this class."""
-        if not hasattr(self, '_logger'):
-            class_name = self.__class__.__name__
-            module_name = self.__class__.__module__
-            self._logger = logger.bind(name=f"{module_name}.{class_name}")
-        return self._logger
+        """Get a logger instance for this class, shared by all its instances."""
+        cls = self.__class__
+        bound = cls.__dict__.get("_class_logger")
+        if bound is None:
+            bound = get_logger(f"{cls.__module__}.{cls.__name__}")
+            cls._class_logger = bound
+        return bound
+    
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether messages at the given level are emitted."""
+        return is_level_enabled(level)
     
     def log_info(self, message: str, **kwargs: Any) -> None:
         """Log an info message with structured data."""
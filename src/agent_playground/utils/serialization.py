@@ -0,0 +1,117 @@
+"""JSON serialization helpers for Agent Playground.
+
+Uses ``orjson`` when it is installed and falls back to the standard library
+otherwise, so callers get the fast path without a hard dependency.
+"""
+
+import json
+from datetime import date, datetime
+from pathlib import PosixPath, PurePath, PurePosixPath, PureWindowsPath, WindowsPath
+from typing import Any, Callable, Dict, Optional
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+_DECODER = json.JSONDecoder()
+
+
+# Exact-type encoders, checked before the isinstance fallbacks in _default
+_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    PosixPath: str,
+    WindowsPath: str,
+    PurePosixPath: str,
+    PureWindowsPath: str,
+}
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types neither JSON backend handles natively."""
+    encoder = _ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, PurePath):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):
+        # numpy arrays and scalars when orjson is not available
+        return obj.tolist()
+    return str(obj)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 bytes
+        
+    Returns:
+        Decoded Python object
+        
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON.
+    
+    Pydantic models, paths, datetimes and numpy values are encoded; anything
+    else unrecognised falls back to ``str()``.
+    
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=_default).encode()
+
+
+def find_json_object(text: str) -> Optional[Any]:
+    """
+    Decode the first JSON object embedded in free text.
+    
+    Decoding starts at the first ``{`` and stops at the end of that object,
+    so trailing prose or markdown after it is ignored.
+    
+    Args:
+        text: Text that may contain a JSON object
+        
+    Returns:
+        Decoded object, or None if the text contains no ``{``
+        
+    Raises:
+        JSONDecodeError: If the object starting at the first ``{`` is invalid
+    """
+    # str.find is a vectorised memchr-style scan and raw_decode is the C
+    # scanner; balanced-brace matching needs recursion, which neither
+    # ``re`` nor DFA engines such as Hyperscan can express.
+    start = text.find("{")
+    if start == -1:
+        return None
+    obj, _ = _DECODER.raw_decode(text, start)
+    return obj
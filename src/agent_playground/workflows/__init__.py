@@ -1,7 +1,8 @@
 """Workflow components for the Agent Playground framework."""
 
-from .builder import WorkflowBuilder
+from .builder import CompiledSequence, WorkflowBuilder
 
 __all__ = [
+    "CompiledSequence",
     "WorkflowBuilder",
 ]
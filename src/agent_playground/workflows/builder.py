@@ -1,11 +1,243 @@
 """Workflow builder for creating reusable agent workflows."""
 
-from typing import Dict, List, Callable, Any, Optional, Union
+import asyncio
+import copy
+import functools
+from collections import OrderedDict
+from itertools import pairwise
+from typing import Dict, List, Callable, Any, Literal, Optional, Tuple, Union
 from langgraph.graph import StateGraph, END
+from pydantic import BaseModel
 from ..core.base import BaseAgent, AgentState
 from ..utils.logging import LoggingMixin
 
 
+# Number of compiled graphs kept by WorkflowBuilder's compile cache
+_COMPILED_CACHE_SIZE = 32
+
+# Entry node of parallel_then_merge, fanning out to every parallel step
+_DISPATCH_STEP = "__dispatch__"
+
+
+def _dispatch(state: Any) -> None:
+    """No-op step whose outgoing edges start the parallel branches."""
+    return None
+
+
+def _merge_auto(state: Any, result: Any) -> None:
+    """Merge a result of any kind into the state."""
+    # Update state if result is a dictionary
+    if isinstance(result, dict):
+        state.update(result)
+    elif result is not None:
+        state['result'] = result
+
+
+def _merge_dict(state: Any, result: Dict[str, Any]) -> None:
+    """Merge a dict result into the state."""
+    state.update(result)
+
+
+def _merge_scalar(state: Any, result: Any) -> None:
+    """Store a plain result under the state's ``result`` key."""
+    state['result'] = result
+
+
+def _merge_state(state: Any, result: Any) -> None:
+    """Keep the state as the step left it."""
+
+
+# How a step's result is merged into the state, by add_step's ``returns``
+_MERGERS: Dict[str, Callable[[Any, Any], None]] = {
+    "auto": _merge_auto,
+    "dict": _merge_dict,
+    "scalar": _merge_scalar,
+    "state": _merge_state,
+}
+
+
+def _finish_step(name: str, logger: Any, debug: bool, state: Any) -> Any:
+    """Return the state of a step that completed."""
+    if debug:
+        logger.debug("Completed step: {}", name)
+    return state
+
+
+def _log_failure(logger: Any, message: str, name: str, error: Exception) -> None:
+    """Log a failed step or router with the same error fields as ``LoggingMixin.log_error``."""
+    logger.error(message, name, error_type=type(error).__name__, error_message=str(error))
+
+
+def _with_error(state: Any, error: Exception) -> Any:
+    """Mark the state as failed, in place when it is a plain dict."""
+    if isinstance(state, dict):
+        state["error"] = str(error)
+        state["completed"] = False
+        return state
+    return {**state, "error": str(error), "completed": False}
+
+
+def _fail_step(name: str, logger: Any, state: Any, error: Exception) -> Any:
+    """Record a step's failure on the state."""
+    _log_failure(logger, "Step failed: {}", name, error)
+    return _with_error(state, error)
+
+
+async def _run_step_sync(
+    name: str,
+    func: Callable,
+    kwargs: Dict[str, Any],
+    merge: Callable[[Any, Any], None],
+    logger: Any,
+    debug: bool,
+    state: Any
+) -> Any:
+    """Graph node body for a step backed by a plain function."""
+    if debug:
+        logger.debug("Executing step: {}", name)
+    try:
+        merge(state, func(state, **kwargs))
+    except Exception as e:
+        return _fail_step(name, logger, state, e)
+    return _finish_step(name, logger, debug, state)
+
+
+async def _run_step_async(
+    name: str,
+    func: Callable,
+    kwargs: Dict[str, Any],
+    merge: Callable[[Any, Any], None],
+    logger: Any,
+    debug: bool,
+    state: Any
+) -> Any:
+    """Graph node body for a step backed by a coroutine function."""
+    if debug:
+        logger.debug("Executing step: {}", name)
+    try:
+        merge(state, await func(state, **kwargs))
+    except Exception as e:
+        return _fail_step(name, logger, state, e)
+    return _finish_step(name, logger, debug, state)
+
+
+def _step_update(state: Any, work: Any) -> Dict[str, Any]:
+    """Keys of ``work`` that were added or reassigned relative to ``state``."""
+    before = dict(state)
+    return {
+        key: value for key, value in dict(work).items()
+        if key not in before or before[key] is not value
+    }
+
+
+async def _run_branch_sync(
+    name: str,
+    func: Callable,
+    kwargs: Dict[str, Any],
+    merge: Callable[[Any, Any], None],
+    logger: Any,
+    debug: bool,
+    state: Any
+) -> Dict[str, Any]:
+    """Graph node body for a parallel step backed by a plain function."""
+    if debug:
+        logger.debug("Executing step: {}", name)
+    work = copy.copy(state)
+    try:
+        merge(work, func(work, **kwargs))
+    except Exception as e:
+        _log_failure(logger, "Step failed: {}", name, e)
+        return {"error": str(e), "completed": False}
+    return _step_update(state, _finish_step(name, logger, debug, work))
+
+
+async def _run_branch_async(
+    name: str,
+    func: Callable,
+    kwargs: Dict[str, Any],
+    merge: Callable[[Any, Any], None],
+    logger: Any,
+    debug: bool,
+    state: Any
+) -> Dict[str, Any]:
+    """Graph node body for a parallel step backed by a coroutine function."""
+    if debug:
+        logger.debug("Executing step: {}", name)
+    work = copy.copy(state)
+    try:
+        merge(work, await func(work, **kwargs))
+    except Exception as e:
+        _log_failure(logger, "Step failed: {}", name, e)
+        return {"error": str(e), "completed": False}
+    return _step_update(state, _finish_step(name, logger, debug, work))
+
+
+# Sync and async node bodies by kind of step. Sequential steps return the
+# whole state; parallel branches share a superstep, so they return only the
+# keys they changed.
+_RUNNERS = {
+    "step": (_run_step_sync, _run_step_async),
+    "branch": (_run_branch_sync, _run_branch_async),
+}
+
+
+def _route(condition: Callable, from_step: str, logger: Any, debug: bool, state: Any) -> Any:
+    """Conditional edge router: the branch key chosen by ``condition``."""
+    try:
+        result = condition(state)
+    except Exception as e:
+        _log_failure(logger, "Branch condition failed: {}", from_step, e)
+        return "error"  # Default error branch
+    if debug:
+        logger.debug("Branch condition result: {}", result)
+    return result
+
+
+class CompiledSequence:
+    """
+    Straight-line workflow run as a single coroutine.
+    
+    Awaits each step node in order without going through LangGraph's
+    scheduler, and exposes the ``ainvoke``/``invoke`` interface of a compiled
+    StateGraph so callers can use either. Like a compiled graph, it runs the
+    steps on a copy of the input coerced to ``state_class`` and returns the
+    final state as a dict.
+    """
+    
+    def __init__(self, name: str, nodes: List[Callable], state_class: type = AgentState):
+        self.name = name
+        self.state_class = state_class
+        self._nodes = tuple(nodes)
+    
+    def _coerce(self, state: Any) -> Any:
+        """Copy the input into a fresh value of the workflow's state class."""
+        if isinstance(self.state_class, type) and issubclass(self.state_class, BaseModel):
+            return self.state_class.model_validate(dict(state))
+        return dict(state)
+    
+    async def ainvoke(self, state: Any, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run every step on a copy of the state in order and return the final state."""
+        state = self._coerce(state)
+        for node in self._nodes:
+            state = await node(state)
+        return dict(state)
+    
+    def invoke(self, state: Any, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Synchronous counterpart of ``ainvoke``.
+        
+        Raises:
+            RuntimeError: If called from a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.ainvoke(state, config))
+        raise RuntimeError(
+            f"{type(self).__name__}.invoke() cannot run inside an event loop; await ainvoke() instead"
+        )
+
+
 class WorkflowBuilder(LoggingMixin):
     """
     Fluent interface for building reusable workflows.
@@ -18,6 +250,11 @@ class WorkflowBuilder(LoggingMixin):
     - Reusable workflow templates
     """
     
+    # Most recently built graphs shared by builders with the same structure,
+    # keyed by the signature computed in ``_signature``. Bounded, since the
+    # signatures hold the step callables and agents of every cached graph.
+    _compiled_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+    
     def __init__(self, state_class: type = AgentState, name: str = "workflow"):
         """
         Initialize workflow builder.
@@ -28,55 +265,103 @@ class WorkflowBuilder(LoggingMixin):
         """
         self.name = name
         self.state_class = state_class
-        self.graph = StateGraph(state_class)
         self.nodes: Dict[str, Callable] = {}
         self._entry_point: Optional[str] = None
         
+        # Whether step execution debug logs reach a sink, checked once up front
+        self._debug_enabled = self.is_enabled_for("DEBUG")
+        
+        # Logger carrying the workflow name, bound once per step at registration
+        self._wf_logger = self.logger.bind(workflow=name)
+        
+        # What each node, edge and router was built from, for the compile cache
+        self._node_specs: Dict[str, tuple] = {}
+        self._edges: List[Tuple[str, str]] = []
+        self._cond_edges: Dict[str, tuple] = {}
+        
         self.log_info(f"Initialized workflow builder: {name}")
     
-    def add_step(self, name: str, func: Callable, **kwargs: Any) -> 'WorkflowBuilder':
+    @functools.cached_property
+    def graph(self) -> StateGraph:
+        """Graph the steps are registered on, created with the first step."""
+        return StateGraph(self.state_class)
+    
+    def add_step(
+        self,
+        name: str,
+        func: Callable,
+        returns: Literal["auto", "dict", "scalar", "state"] = "auto",
+        **kwargs: Any
+    ) -> 'WorkflowBuilder':
         """
         Add a processing step to the workflow.
         
+        Whether ``func`` (or its ``__call__``) is a coroutine function is
+        decided here, once, rather than on every execution of the step. A non-callable ``func`` is used
+        as the step's constant result.
+        
         Args:
             name: Step name
             func: Processing function
+            returns: What ``func`` returns, so its result is merged without a
+                per-call type check: "dict" (merged into the state),
+                "scalar" (stored under ``result``), "state" (ignored) or
+                "auto" (checked on every call)
             **kwargs: Additional arguments for the function
             
         Returns:
             Self for chaining
-        """
-        async def wrapped_func(state):
-            self.log_debug(f"Executing step: {name}", workflow=self.name, step=name)
             
-            try:
-                # Handle both sync and async functions
-                if callable(func):
-                    if hasattr(func, '__call__'):
-                        result = func(state, **kwargs)
-                        # Handle async functions
-                        if hasattr(result, '__await__'):
-                            result = await result
-                    else:
-                        result = func
-                else:
-                    result = func
-                
-                # Update state if result is a dictionary
-                if isinstance(result, dict):
-                    state.update(result)
-                elif result is not None:
-                    state['result'] = result
-                
-                self.log_debug(f"Completed step: {name}", workflow=self.name, step=name)
-                return state
+        Raises:
+            ValueError: If ``returns`` is not a known kind
+        """
+        return self._add_step(name, func, returns, kwargs, "step")
+    
+    def _add_step(
+        self,
+        name: str,
+        func: Callable,
+        returns: str,
+        kwargs: Dict[str, Any],
+        kind: Literal["step", "branch"]
+    ) -> 'WorkflowBuilder':
+        """Wrap ``func`` in the node body for ``kind`` and register it."""
+        return self._add_node(name, *self._make_node(name, func, returns, kwargs, kind))
+    
+    def _make_node(
+        self,
+        name: str,
+        func: Callable,
+        returns: str,
+        kwargs: Dict[str, Any],
+        kind: Literal["step", "branch"]
+    ) -> Tuple[Callable, tuple]:
+        """Wrap ``func`` in the node body for ``kind``; returns the node and its spec."""
+        if returns not in _MERGERS:
+            raise ValueError(f"returns must be one of {list(_MERGERS)}, got {returns!r}")
+        spec = (kind, func, returns, tuple(sorted(kwargs.items())))
+        merge = _MERGERS[returns]
+        run_sync, run_async = _RUNNERS[kind]
+        
+        if asyncio.iscoroutinefunction(func) or asyncio.iscoroutinefunction(getattr(func, "__call__", None)):
+            run_step = run_async
+        else:
+            run_step = run_sync
+            if not callable(func):
+                value = func
                 
-            except Exception as e:
-                self.log_error(f"Step failed: {name}", error=e, workflow=self.name, step=name)
-                return {**state, "error": str(e), "completed": False}
+                def func(state: Any, **_: Any) -> Any:
+                    return value
+        step_logger = self._wf_logger.bind(step=name)
+        wrapped_func = functools.partial(run_step, name, func, kwargs, merge, step_logger, self._debug_enabled)
         
-        self.nodes[name] = wrapped_func
-        self.graph.add_node(name, wrapped_func)
+        return wrapped_func, spec
+    
+    def _add_node(self, name: str, node: Callable, spec: tuple) -> 'WorkflowBuilder':
+        """Register a ready-made graph node and what it was built from."""
+        self.nodes[name] = node
+        self._node_specs[name] = spec
+        self.graph.add_node(name, node)
         
         self.log_debug(f"Added step: {name}", workflow=self.name)
         return self
@@ -85,6 +370,9 @@ class WorkflowBuilder(LoggingMixin):
         """
         Add an agent as a workflow step.
         
+        The agent node handles its own logging and errors, so it is added to
+        the graph as is rather than wrapped again by ``add_step``.
+        
         Args:
             name: Step name
             agent: Agent instance to add
@@ -92,17 +380,21 @@ class WorkflowBuilder(LoggingMixin):
         Returns:
             Self for chaining
         """
+        agent_logger = self._wf_logger.bind(step=name, agent=agent.config.name)
+        debug = self._debug_enabled
+        
         async def agent_step(state):
-            self.log_debug(f"Executing agent step: {name}", workflow=self.name, agent=agent.config.name)
+            if debug:
+                agent_logger.debug("Executing agent step: {}", name)
             
             try:
                 result = await agent.run(state)
                 return result.model_dump()
             except Exception as e:
-                self.log_error(f"Agent step failed: {name}", error=e, workflow=self.name, agent=agent.config.name)
-                return {**state, "error": str(e), "completed": False}
+                _log_failure(agent_logger, "Agent step failed: {}", name, e)
+                return _with_error(state, e)
         
-        return self.add_step(name, agent_step)
+        return self._add_node(name, agent_step, ("agent", agent))
     
     def add_lambda_step(self, name: str, func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> 'WorkflowBuilder':
         """
@@ -129,6 +421,7 @@ class WorkflowBuilder(LoggingMixin):
             Self for chaining
         """
         self.graph.add_edge(from_step, to_step)
+        self._edges.append((from_step, to_step))
         self.log_debug(f"Added edge: {from_step} -> {to_step}", workflow=self.name)
         return self
     
@@ -143,6 +436,7 @@ class WorkflowBuilder(LoggingMixin):
             Self for chaining
         """
         self.graph.add_edge(step, END)
+        self._edges.append((step, END))
         self.log_debug(f"Added edge to END: {step}", workflow=self.name)
         return self
     
@@ -158,16 +452,10 @@ class WorkflowBuilder(LoggingMixin):
         Returns:
             Self for chaining
         """
-        def wrapped_condition(state):
-            try:
-                result = condition(state)
-                self.log_debug(f"Branch condition result: {result}", workflow=self.name, step=from_step)
-                return result
-            except Exception as e:
-                self.log_error(f"Branch condition failed", error=e, workflow=self.name, step=from_step)
-                return "error"  # Default error branch
-        
+        route_logger = self._wf_logger.bind(step=from_step)
+        wrapped_condition = functools.partial(_route, condition, from_step, route_logger, self._debug_enabled)
         self.graph.add_conditional_edges(from_step, wrapped_condition, branches)
+        self._cond_edges[from_step] = (condition, tuple(branches.items()))
         self.log_debug(f"Added conditional edges from: {from_step}", workflow=self.name, branches=list(branches.keys()))
         return self
     
@@ -186,10 +474,37 @@ class WorkflowBuilder(LoggingMixin):
         self.log_debug(f"Set entry point: {step_name}", workflow=self.name)
         return self
     
+    def _signature(self) -> Optional[tuple]:
+        """
+        Structural signature of the workflow built so far.
+        
+        Two builders with the same signature register the same functions under
+        the same names, wire them identically and log steps at the same level,
+        so they compile to interchangeable graphs. Returns None when a step
+        argument is unhashable.
+        """
+        signature = (
+            self.state_class,
+            self.name,
+            self._debug_enabled,
+            tuple(sorted(self._node_specs.items())),
+            tuple(sorted(self._edges)),
+            tuple(sorted(self._cond_edges.items())),
+            self._entry_point,
+        )
+        try:
+            hash(signature)
+        except TypeError:
+            return None
+        return signature
+    
     def build(self) -> StateGraph:
         """
         Build and compile the workflow.
         
+        The compiled graph is shared with any recent builder of the same
+        structure (see ``_signature``) instead of being compiled again.
+        
         Returns:
             Compiled StateGraph
             
@@ -201,15 +516,28 @@ class WorkflowBuilder(LoggingMixin):
         
         self.log_info(f"Building workflow: {self.name}", steps=list(self.nodes.keys()), entry_point=self._entry_point)
         
-        return self.graph.compile()
+        signature = self._signature()
+        if signature is None:
+            return self.graph.compile()
+        
+        cache = self._compiled_cache
+        compiled = cache.get(signature)
+        if compiled is not None:
+            cache.move_to_end(signature)
+            return compiled
+        compiled = cache[signature] = self.graph.compile()
+        if len(cache) > _COMPILED_CACHE_SIZE:
+            cache.popitem(last=False)
+        return compiled
     
     @classmethod
     def sequential(
         cls, 
         steps: List[tuple[str, Callable]], 
         state_class: type = AgentState,
-        name: str = "sequential_workflow"
-    ) -> StateGraph:
+        name: str = "sequential_workflow",
+        fused: bool = False
+    ) -> Union[StateGraph, CompiledSequence]:
         """
         Create a simple sequential workflow.
         
@@ -217,17 +545,21 @@ class WorkflowBuilder(LoggingMixin):
             steps: List of (name, function) tuples
             state_class: State class to use
             name: Workflow name
+            fused: Run the steps as one coroutine instead of building a StateGraph
             
         Returns:
-            Compiled StateGraph
+            Compiled StateGraph, or a CompiledSequence when ``fused`` is set
         """
         builder = cls(state_class, name)
         
-        for i, (step_name, func) in enumerate(steps):
+        if fused:
+            nodes = [builder._make_node(step_name, func, "auto", {}, "step")[0] for step_name, func in steps]
+            return CompiledSequence(name, nodes, state_class)
+        
+        for step_name, func in steps:
             builder.add_step(step_name, func)
-            
-            if i > 0:
-                builder.chain(steps[i-1][0], step_name)
+        for (prev_name, _), (step_name, _) in pairwise(steps):
+            builder.chain(prev_name, step_name)
         
         if steps:
             builder.start_with(steps[0][0])
@@ -246,6 +578,15 @@ class WorkflowBuilder(LoggingMixin):
         """
         Create a workflow that runs steps in parallel then merges.
         
+        A no-op dispatch step fans out to every parallel step, and the merge
+        step runs once all of them have finished. Parallel steps run in the
+        same graph superstep on their own shallow copy of the state, and each
+        returns only the keys it set or reassigned, so they must write
+        disjoint state keys (or keys with a reducer). Values mutated in place
+        are not picked up. ``state_class`` must have one channel per key, such
+        as a TypedDict; a plain ``dict`` state is a single value that every
+        branch would overwrite.
+        
         Args:
             parallel_steps: List of (name, function) tuples to run in parallel
             merge_step: (name, function) tuple for merging results
@@ -256,23 +597,29 @@ class WorkflowBuilder(LoggingMixin):
             Compiled StateGraph
         """
         builder = cls(state_class, name)
+        merge_name, merge_func = merge_step
+        
+        # Without parallel steps the workflow is just the merge step
+        if not parallel_steps:
+            builder.add_step(merge_name, merge_func)
+            builder.start_with(merge_name)
+            builder.chain_to_end(merge_name)
+            return builder.build()
         
-        # Add all parallel steps
+        # Add all parallel steps, fanned out from the dispatch step
+        builder.add_step(_DISPATCH_STEP, _dispatch)
         for step_name, func in parallel_steps:
-            builder.add_step(step_name, func)
+            builder._add_step(step_name, func, "auto", {}, "branch")
+            builder.chain(_DISPATCH_STEP, step_name)
         
         # Add merge step
-        merge_name, merge_func = merge_step
         builder.add_step(merge_name, merge_func)
         
         # Connect all parallel steps to merge step
         for step_name, _ in parallel_steps:
             builder.chain(step_name, merge_name)
         
-        # Set first parallel step as entry point
-        if parallel_steps:
-            builder.start_with(parallel_steps[0][0])
-        
+        builder.start_with(_DISPATCH_STEP)
         builder.chain_to_end(merge_name)
         
         return builder.build()
@@ -317,11 +664,10 @@ class WorkflowBuilder(LoggingMixin):
         # Add branch steps
         branch_mapping = {}
         for branch_key, branch_steps in branches.items():
-            for i, (step_name, func) in enumerate(branch_steps):
+            for step_name, func in branch_steps:
                 builder.add_step(step_name, func)
-                
-                if i > 0:
-                    builder.chain(branch_steps[i-1][0], step_name)
+            for (prev_name, _), (step_name, _) in pairwise(branch_steps):
+                builder.chain(prev_name, step_name)
             
             if branch_steps:
                 branch_mapping[branch_key] = branch_steps[0][0]
@@ -333,10 +679,7 @@ class WorkflowBuilder(LoggingMixin):
                     builder.chain_to_end(branch_steps[-1][0])
         
         # Add conditional edges
-        def condition_router(state):
-            return cond_func(state)
-        
-        builder.branch(cond_name, condition_router, branch_mapping)
+        builder.branch(cond_name, cond_func, branch_mapping)
         
         # Add final step if provided
         if final_step:
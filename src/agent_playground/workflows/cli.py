@@ -1,30 +1,65 @@
 """CLI for workflow templates and examples."""
 
 import asyncio
-import json
+import contextlib
+import functools
+import os
+import re
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress
-from rich import print as rprint
-
-from .templates import workflow_templates, WorkflowTemplateRegistry
-from .examples import get_example_workflows
-from .monitor import WorkflowExecutor, WorkflowScheduler
+
 from ..utils.logging import get_logger
+from ..utils.serialization import json_dumps, json_loads
+
+if TYPE_CHECKING:
+    from .monitor import WorkflowExecutor
 
 app = typer.Typer(name="workflows", help="Workflow templates and examples management")
 console = Console()
 logger = get_logger("workflow_cli")
 
+# Report file names written by WorkflowMonitor.generate_report
+_PAT_REPORT = re.compile(r".*_report_.*\.html")
+_PAT_INTERACTIVE = re.compile(r".*_interactive_.*\.html")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> "WorkflowExecutor":
+    """Process-wide executor, so every command sees the same active workflows."""
+    from .monitor import WorkflowExecutor
+    
+    return WorkflowExecutor()
+
+
+@functools.lru_cache(maxsize=64)
+def _create_workflow_cached(template_name: str, config_key: tuple) -> Any:
+    """Template workflow for a hashable config, built once per process."""
+    from .templates import workflow_templates
+    
+    return workflow_templates.create_workflow(template_name, **dict(config_key))
+
+
+def _create_workflow(template_name: str, config: Dict[str, Any]) -> Any:
+    """Create a workflow from a template, reusing one built from the same config."""
+    config_key = tuple(sorted(config.items()))
+    try:
+        hash(config_key)
+    except TypeError:
+        # Lists and dicts from JSON configs cannot key the cache
+        from .templates import workflow_templates
+        return workflow_templates.create_workflow(template_name, **config)
+    return _create_workflow_cached(template_name, config_key)
+
 
 @app.command("list-templates")
 def list_templates():
     """List all available workflow templates."""
+    from rich.table import Table
+    from .templates import workflow_templates
+    
     templates = workflow_templates.list_templates()
     
     if not templates:
@@ -55,6 +90,9 @@ def template_info(
     name: str = typer.Argument(..., help="Template name")
 ):
     """Get detailed information about a workflow template."""
+    from rich.panel import Panel
+    from .templates import workflow_templates
+    
     info = workflow_templates.get_template_info(name)
     
     if not info:
@@ -78,6 +116,9 @@ def template_info(
 @app.command("list-examples")
 def list_examples():
     """List all available workflow examples."""
+    from rich.table import Table
+    from .examples import get_example_workflows
+    
     examples = get_example_workflows()
     
     if not examples:
@@ -109,6 +150,9 @@ def run_example(
     generate_report: bool = typer.Option(True, help="Generate execution report")
 ):
     """Run an example workflow."""
+    from rich.panel import Panel
+    from .examples import get_example_workflows
+    
     examples = get_example_workflows()
     
     if example_key not in examples:
@@ -140,11 +184,20 @@ def run_example(
 
 async def _run_workflow_async(workflow, initial_state, output_dir, monitor, generate_report):
     """Run workflow asynchronously with progress tracking."""
-    executor = WorkflowExecutor()
+    from rich.panel import Panel
+    
+    executor = _get_executor()
+    
+    # The progress bar renders from its own thread; skip it off-terminal
+    if console.is_terminal:
+        from rich.progress import Progress
+        progress_cm = Progress(console=console)
+    else:
+        progress_cm = contextlib.nullcontext()
     
     try:
-        with Progress() as progress:
-            task = progress.add_task("Executing workflow...", total=100)
+        with progress_cm as progress:
+            task = progress.add_task("Executing workflow...", total=100) if progress is not None else None
             
             # Execute workflow
             final_state, workflow_monitor = await executor.execute_workflow(
@@ -155,7 +208,8 @@ async def _run_workflow_async(workflow, initial_state, output_dir, monitor, gene
                 output_dir=output_dir
             )
             
-            progress.update(task, completed=100)
+            if task is not None:
+                progress.update(task, completed=100)
         
         # Display results
         console.print("\n[green]✅ Workflow completed successfully![/green]")
@@ -191,6 +245,8 @@ def create_from_template(
     output_dir: str = typer.Option("workflow_reports", help="Output directory for reports")
 ):
     """Create and run a workflow from a template."""
+    from .templates import workflow_templates
+    
     if not workflow_templates.get(template_name):
         console.print(f"[red]Template '{template_name}' not found.[/red]")
         raise typer.Exit(1)
@@ -198,8 +254,7 @@ def create_from_template(
     # Load configuration
     if config_file:
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            config = json_loads(Path(config_file).read_bytes())
         except Exception as e:
             console.print(f"[red]Error loading config file: {e}[/red]")
             raise typer.Exit(1)
@@ -209,7 +264,7 @@ def create_from_template(
     
     # Create workflow from template
     try:
-        workflow = workflow_templates.create_workflow(template_name, **config)
+        workflow = _create_workflow(template_name, config)
         if not workflow:
             console.print(f"[red]Failed to create workflow from template '{template_name}'[/red]")
             raise typer.Exit(1)
@@ -228,6 +283,8 @@ def generate_template_config(
     output_file: str = typer.Option("template_config.json", help="Output config file")
 ):
     """Generate a sample configuration file for a template."""
+    from .templates import workflow_templates
+    
     info = workflow_templates.get_template_info(template_name)
     
     if not info:
@@ -247,8 +304,7 @@ def generate_template_config(
     
     # Save configuration
     try:
-        with open(output_file, 'w') as f:
-            json.dump(config, f, indent=2, default=str)
+        Path(output_file).write_bytes(json_dumps(config, indent=True))
         
         console.print(f"[green]✅ Generated sample config: {output_file}[/green]")
         console.print("[yellow]Please edit the config file to provide actual values.[/yellow]")
@@ -261,7 +317,9 @@ def generate_template_config(
 @app.command("monitor")
 def monitor_workflows():
     """Monitor active workflows."""
-    executor = WorkflowExecutor()
+    from rich.table import Table
+    
+    executor = _get_executor()
     active_workflows = executor.get_active_workflows()
     
     if not active_workflows:
@@ -303,15 +361,32 @@ def visualize_workflow(
     interactive: bool = typer.Option(False, help="Open interactive visualization")
 ):
     """Visualize workflow execution results."""
+    from rich.panel import Panel
+    
     report_path = Path(report_dir)
     
     if not report_path.exists():
         console.print(f"[red]Report directory not found: {report_dir}[/red]")
         raise typer.Exit(1)
     
-    # Find report files
-    html_reports = list(report_path.glob("*_report_*.html"))
-    interactive_reports = list(report_path.glob("*_interactive_*.html"))
+    # Find report files in one directory pass, keeping only their names.
+    # The newest interactive report is tracked during the scan, and entries
+    # are only stat-ed when it will be opened.
+    html_reports = []
+    interactive_reports = []
+    latest_interactive = None
+    latest_mtime = -1
+    with os.scandir(report_path) as entries:
+        for entry in entries:
+            name = entry.name
+            if _PAT_REPORT.fullmatch(name):
+                html_reports.append(name)
+            if _PAT_INTERACTIVE.fullmatch(name):
+                interactive_reports.append(name)
+                if interactive:
+                    mtime = entry.stat().st_mtime_ns
+                    if mtime > latest_mtime:
+                        latest_interactive, latest_mtime = entry.path, mtime
     
     if not html_reports and not interactive_reports:
         console.print(f"[yellow]No workflow reports found in: {report_dir}[/yellow]")
@@ -327,16 +402,16 @@ def visualize_workflow(
     if html_reports:
         console.print("\n[cyan]HTML Reports:[/cyan]")
         for report in html_reports:
-            console.print(f"  • {report.name}")
+            console.print(f"  • {report}")
     
     if interactive_reports:
         console.print("\n[magenta]Interactive Reports:[/magenta]")
         for report in interactive_reports:
-            console.print(f"  • {report.name}")
+            console.print(f"  • {report}")
     
     if interactive and interactive_reports:
         import webbrowser
-        latest_interactive = max(interactive_reports, key=lambda p: p.stat().st_mtime)
+        latest_interactive = Path(latest_interactive)
         webbrowser.open(f"file://{latest_interactive.absolute()}")
         console.print(f"[green]Opened interactive report: {latest_interactive.name}[/green]")
 
@@ -1,12 +1,17 @@
 """Example workflows demonstrating various agent patterns."""
 
-from typing import Dict, Any, List, Optional
+import os
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Type, TypeVar
 from pathlib import Path
 
 from ..core.base import BaseAgent, BaseState, AgentConfig
 from ..utils.logging import get_logger
 from .templates import workflow_templates
 
+A = TypeVar("A", bound=BaseAgent)
+
 
 class DocumentProcessingState(BaseState):
     """State for document processing workflow."""
@@ -19,6 +24,20 @@ class DocumentProcessingState(BaseState):
         self.processed_documents: List[str] = data.get("processed_documents", [])
 
 
+# Simulated extraction text by document extension
+_EXTRACTED_TEXT = {
+    ".pdf": "Extracted PDF text from {}",
+    ".docx": "Extracted Word text from {}",
+    ".txt": "Plain text content from {}",
+}
+_GENERIC_TEXT = "Generic text extraction from {}"
+
+
+def _extract_text(doc_path: str) -> str:
+    """Extract the text of one document."""
+    return _EXTRACTED_TEXT.get(os.path.splitext(doc_path)[1], _GENERIC_TEXT).format(doc_path)
+
+
 class TextExtractionAgent(BaseAgent):
     """Agent for extracting text from documents."""
     
@@ -34,23 +53,21 @@ class TextExtractionAgent(BaseAgent):
         """Extract text from documents."""
         self.logger.info(f"Extracting text from {len(state.documents)} documents")
         
-        for doc_path in state.documents:
-            # Simulate text extraction
-            if doc_path.endswith('.pdf'):
-                text = f"Extracted PDF text from {doc_path}"
-            elif doc_path.endswith('.docx'):
-                text = f"Extracted Word text from {doc_path}"
-            elif doc_path.endswith('.txt'):
-                text = f"Plain text content from {doc_path}"
-            else:
-                text = f"Generic text extraction from {doc_path}"
-            
-            state.extracted_text[doc_path] = text
+        # Simulate text extraction
+        state.extracted_text.update({doc_path: _extract_text(doc_path) for doc_path in state.documents})
         
         state.mark_step_completed("text_extraction")
         return state
 
 
+# Simulated classification fields shared by every document. Only immutable
+# values live here; lists are built per document.
+_CLASSIFICATION = {
+    "category": "business_document",
+    "confidence": 0.85
+}
+
+
 class ContentAnalysisAgent(BaseAgent):
     """Agent for analyzing document content."""
     
@@ -97,16 +114,10 @@ class DocumentClassificationAgent(BaseAgent):
         self.logger.info(f"Classifying {len(state.analysis_results)} documents")
         
         for doc_path, analysis in state.analysis_results.items():
-            # Simulate document classification
-            classification = {
-                "document_type": "report" if "report" in doc_path.lower() else "general",
-                "category": "business_document",
-                "confidence": 0.85,
-                "tags": ["processed", "analyzed"]
-            }
-            
-            # Update analysis with classification
-            state.analysis_results[doc_path].update(classification)
+            # Simulate document classification and update analysis with it
+            analysis["document_type"] = "report" if "report" in doc_path.lower() else "general"
+            analysis.update(_CLASSIFICATION)
+            analysis["tags"] = ["processed", "analyzed"]
             state.processed_documents.append(doc_path)
         
         state.mark_step_completed("document_classification")
@@ -125,6 +136,15 @@ class DataAnalysisState(BaseState):
         self.recommendations: List[str] = data.get("recommendations", [])
 
 
+# Simulated cleaning statistics reported for every data set
+_CLEANING_STATS = {
+    "nulls_removed": 15,
+    "duplicates_removed": 3,
+    "outliers_handled": 2,
+    "normalization_applied": True
+}
+
+
 class DataCleaningAgent(BaseAgent):
     """Agent for cleaning and preprocessing data."""
     
@@ -142,14 +162,7 @@ class DataCleaningAgent(BaseAgent):
         
         # Simulate data cleaning
         for key, data in state.raw_data.items():
-            cleaned = {
-                "records": data.get("records", []),
-                "nulls_removed": 15,
-                "duplicates_removed": 3,
-                "outliers_handled": 2,
-                "normalization_applied": True
-            }
-            state.cleaned_data[key] = cleaned
+            state.cleaned_data[key] = {"records": data.get("records", []), **_CLEANING_STATS}
         
         state.mark_step_completed("data_cleaning")
         return state
@@ -171,7 +184,7 @@ class StatisticalAnalysisAgent(BaseAgent):
         self.logger.info("Performing statistical analysis")
         
         # Simulate statistical analysis
-        stats = {
+        state.analysis_results["statistical"] = {
             "descriptive_stats": {
                 "mean": 45.6,
                 "median": 42.0,
@@ -188,8 +201,6 @@ class StatisticalAnalysisAgent(BaseAgent):
                 "growth_rate": 0.05
             }
         }
-        
-        state.analysis_results["statistical"] = stats
         state.mark_step_completed("statistical_analysis")
         return state
 
@@ -210,7 +221,7 @@ class PredictiveAnalysisAgent(BaseAgent):
         self.logger.info("Performing predictive analysis")
         
         # Simulate predictive analysis
-        predictions = {
+        state.analysis_results["predictive"] = {
             "model_type": "random_forest",
             "accuracy": 0.87,
             "feature_importance": {
@@ -224,8 +235,6 @@ class PredictiveAnalysisAgent(BaseAgent):
                 "confidence_interval": [145.1, 159.5]
             }
         }
-        
-        state.analysis_results["predictive"] = predictions
         state.mark_step_completed("predictive_analysis")
         return state
 
@@ -285,6 +294,37 @@ class CustomerServiceState(BaseState):
         self.satisfaction_score: Optional[float] = data.get("satisfaction_score")
 
 
+def _keyword_scanner(keywords: Dict[str, str]) -> "re.Pattern[str]":
+    """
+    Compile keywords into one pattern reporting every occurrence in a single pass.
+    
+    The alternation sits in a lookahead, so occurrences that overlap are all
+    reported, as with separate ``in`` checks.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+
+
+# Simulated intent keywords, in priority order
+_INTENT_KEYWORDS = {
+    "refund": "refund_request",
+    "return": "refund_request",
+    "billing": "billing_inquiry",
+    "charge": "billing_inquiry",
+    "support": "technical_support",
+    "help": "technical_support",
+    "cancel": "cancellation",
+}
+_INTENT_PRIORITY = tuple(dict.fromkeys(_INTENT_KEYWORDS.values()))
+_INTENT_SCANNER = _keyword_scanner(_INTENT_KEYWORDS)
+
+# Simulated sentiment keywords; negative words take precedence
+_SENTIMENT_KEYWORDS = {
+    **dict.fromkeys(("angry", "frustrated", "terrible", "awful", "hate"), "negative"),
+    **dict.fromkeys(("great", "excellent", "love", "amazing", "wonderful"), "positive"),
+}
+_SENTIMENT_SCANNER = _keyword_scanner(_SENTIMENT_KEYWORDS)
+
+
 class IntentClassificationAgent(BaseAgent):
     """Agent for classifying customer intent."""
     
@@ -301,17 +341,11 @@ class IntentClassificationAgent(BaseAgent):
         self.logger.info(f"Classifying intent for customer: {state.customer_id}")
         
         # Simulate intent classification
-        query_lower = state.customer_query.lower()
-        if "refund" in query_lower or "return" in query_lower:
-            state.intent = "refund_request"
-        elif "billing" in query_lower or "charge" in query_lower:
-            state.intent = "billing_inquiry"
-        elif "support" in query_lower or "help" in query_lower:
-            state.intent = "technical_support"
-        elif "cancel" in query_lower:
-            state.intent = "cancellation"
-        else:
-            state.intent = "general_inquiry"
+        found = {
+            _INTENT_KEYWORDS[match.group(1)]
+            for match in _INTENT_SCANNER.finditer(state.customer_query.lower())
+        }
+        state.intent = next((intent for intent in _INTENT_PRIORITY if intent in found), "general_inquiry")
         
         state.mark_step_completed("intent_classification")
         return state
@@ -333,13 +367,13 @@ class SentimentAnalysisAgent(BaseAgent):
         self.logger.info(f"Analyzing sentiment for customer: {state.customer_id}")
         
         # Simulate sentiment analysis
-        query_lower = state.customer_query.lower()
-        negative_words = ["angry", "frustrated", "terrible", "awful", "hate"]
-        positive_words = ["great", "excellent", "love", "amazing", "wonderful"]
-        
-        if any(word in query_lower for word in negative_words):
+        found = {
+            _SENTIMENT_KEYWORDS[match.group(1)]
+            for match in _SENTIMENT_SCANNER.finditer(state.customer_query.lower())
+        }
+        if "negative" in found:
             state.sentiment = "negative"
-        elif any(word in query_lower for word in positive_words):
+        elif "positive" in found:
             state.sentiment = "positive"
         else:
             state.sentiment = "neutral"
@@ -391,14 +425,19 @@ class ResponseGenerationAgent(BaseAgent):
         return state
 
 
+@lru_cache(maxsize=None)
+def _agent(agent_class: Type[A]) -> A:
+    """Shared instance of a stateless example agent."""
+    return agent_class()
+
+
+@lru_cache(maxsize=1)
 def create_document_processing_workflow():
-    """Create a document processing workflow example."""
-    from .templates import workflow_templates
-    
+    """Create a document processing workflow example (built once and shared)."""
     # Create agents
-    extractor = TextExtractionAgent()
-    analyzer = ContentAnalysisAgent()
-    classifier = DocumentClassificationAgent()
+    extractor = _agent(TextExtractionAgent)
+    analyzer = _agent(ContentAnalysisAgent)
+    classifier = _agent(DocumentClassificationAgent)
     
     # Create workflow using sequential template
     workflow = workflow_templates.create_workflow(
@@ -410,15 +449,14 @@ def create_document_processing_workflow():
     return workflow
 
 
+@lru_cache(maxsize=1)
 def create_data_analysis_workflow():
-    """Create a data analysis workflow example."""
-    from .templates import workflow_templates
-    
+    """Create a data analysis workflow example (built once and shared)."""
     # Create agents
-    cleaner = DataCleaningAgent()
-    stat_analyzer = StatisticalAnalysisAgent()
-    pred_analyzer = PredictiveAnalysisAgent()
-    insight_generator = InsightGenerationAgent()
+    cleaner = _agent(DataCleaningAgent)
+    stat_analyzer = _agent(StatisticalAnalysisAgent)
+    pred_analyzer = _agent(PredictiveAnalysisAgent)
+    insight_generator = _agent(InsightGenerationAgent)
     
     # Create workflow using analysis template
     workflow = workflow_templates.create_workflow(
@@ -432,20 +470,21 @@ def create_data_analysis_workflow():
     return workflow
 
 
+@lru_cache(maxsize=1)
 def create_customer_service_workflow():
-    """Create a customer service workflow example."""
-    from .templates import workflow_templates
-    
+    """Create a customer service workflow example (built once and shared)."""
     # Create agents
-    intent_classifier = IntentClassificationAgent()
-    sentiment_analyzer = SentimentAnalysisAgent()
-    response_generator = ResponseGenerationAgent()
+    intent_classifier = _agent(IntentClassificationAgent)
+    sentiment_analyzer = _agent(SentimentAnalysisAgent)
+    response_generator = _agent(ResponseGenerationAgent)
     
-    # Create workflow using parallel template for analysis, then response
-    # This is a simplified example - a real implementation might be more complex
+    # Intent and sentiment both only read the query and write their own
+    # field, so the analysis template fans them out before the response
     workflow = workflow_templates.create_workflow(
-        template_name="sequential",
-        agents=[intent_classifier, sentiment_analyzer, response_generator],
+        template_name="analysis",
+        preprocessor_agent=None,
+        analysis_agents=[intent_classifier, sentiment_analyzer],
+        synthesizer_agent=response_generator,
         state_class=CustomerServiceState
     )
     
@@ -207,43 +207,78 @@ class WorkflowMonitor:
             "progress": self.current_state.get_progress_percentage() if self.current_state and hasattr(self.current_state, 'get_progress_percentage') else 0
         }
     
-    def generate_report(self, output_dir: str = "workflow_reports") -> Dict[str, str]:
-        """Generate comprehensive execution report."""
+    def _report_paths(self, output_dir: str) -> Dict[str, str]:
+        """Create the report directory and name each report file in it."""
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         workflow_name = self.workflow.name.replace(" ", "_")
         
+        return {
+            "timeline": str(output_path / f"{workflow_name}_timeline_{timestamp}.png"),
+            "graph": str(output_path / f"{workflow_name}_graph_{timestamp}.png"),
+            "html_report": str(output_path / f"{workflow_name}_report_{timestamp}.html"),
+            "interactive": str(output_path / f"{workflow_name}_interactive_{timestamp}.html"),
+            "data": str(output_path / f"{workflow_name}_data_{timestamp}.json"),
+        }
+    
+    def _generate_charts(self, paths: Dict[str, str]) -> Dict[str, str]:
+        """Render the matplotlib charts, returning the ones written."""
         reports = {}
         
         # Generate timeline visualization
-        timeline_path = output_path / f"{workflow_name}_timeline_{timestamp}.png"
-        if self.visualizer.generate_execution_timeline(str(timeline_path)):
-            reports["timeline"] = str(timeline_path)
+        if self.visualizer.generate_execution_timeline(paths["timeline"]):
+            reports["timeline"] = paths["timeline"]
         
         # Generate workflow graph
-        graph_path = output_path / f"{workflow_name}_graph_{timestamp}.png"
-        if self.visualizer.generate_workflow_graph(str(graph_path)):
-            reports["graph"] = str(graph_path)
-        
-        # Generate HTML report
-        html_path = output_path / f"{workflow_name}_report_{timestamp}.html"
-        reports["html_report"] = self.visualizer.generate_html_report(str(html_path))
+        if self.visualizer.generate_workflow_graph(paths["graph"]):
+            reports["graph"] = paths["graph"]
         
-        # Generate interactive visualization
-        interactive_path = output_path / f"{workflow_name}_interactive_{timestamp}.html"
-        reports["interactive"] = self.interactive_visualizer.generate_interactive_graph(
+        return reports
+    
+    def _generate_interactive(self, path: str) -> str:
+        """Write the interactive visualization."""
+        return self.interactive_visualizer.generate_interactive_graph(
             self.workflow,
             self.visualizer.execution_data,
-            str(interactive_path)
+            path
         )
+    
+    def generate_report(self, output_dir: str = "workflow_reports") -> Dict[str, str]:
+        """Generate comprehensive execution report."""
+        paths = self._report_paths(output_dir)
+        reports = self._generate_charts(paths)
+        
+        # Generate HTML report, interactive visualization and data export
+        reports["html_report"] = self.visualizer.generate_html_report(paths["html_report"])
+        reports["interactive"] = self._generate_interactive(paths["interactive"])
+        reports["data"] = self.visualizer.export_data(paths["data"])
         
-        # Export execution data
-        data_path = output_path / f"{workflow_name}_data_{timestamp}.json"
-        reports["data"] = self.visualizer.export_data(str(data_path))
+        self.logger.info(f"Generated workflow report in: {output_dir}")
+        return reports
+    
+    async def agenerate_report(self, output_dir: str = "workflow_reports") -> Dict[str, str]:
+        """
+        Generate the execution report without blocking the event loop on file I/O.
+        
+        The HTML report, interactive visualization and data export are written
+        concurrently in worker threads. The matplotlib charts are rendered on
+        the calling thread meanwhile, since pyplot is not thread-safe.
+        """
+        paths = await asyncio.to_thread(self._report_paths, output_dir)
+        
+        writers = asyncio.gather(
+            asyncio.to_thread(self.visualizer.generate_html_report, paths["html_report"]),
+            asyncio.to_thread(self._generate_interactive, paths["interactive"]),
+            asyncio.to_thread(self.visualizer.export_data, paths["data"]),
+        )
+        # Let the writer tasks hand their work to the threads before rendering
+        await asyncio.sleep(0)
+        reports = self._generate_charts(paths)
+        reports["html_report"], reports["interactive"], reports["data"] = await writers
         
-        self.logger.info(f"Generated workflow report in: {output_path}")
+        self.logger.info(f"Generated workflow report in: {output_dir}")
         return reports
 
 
@@ -280,7 +315,7 @@ class WorkflowExecutor:
                 workflow_monitor.complete_monitoring(final_state)
                 
                 if generate_report:
-                    reports = workflow_monitor.generate_report(output_dir)
+                    reports = await workflow_monitor.agenerate_report(output_dir)
                     self.logger.info(f"Generated reports: {list(reports.keys())}")
             
             return final_state, workflow_monitor
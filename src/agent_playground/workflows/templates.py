@@ -409,6 +409,8 @@ class WorkflowTemplateRegistry:
     
     def __init__(self):
         self._templates: Dict[str, WorkflowTemplate] = {}
+        # Template info by name, built on first request
+        self._info_cache: Dict[str, Dict[str, Any]] = {}
         self.logger = get_logger("workflow_template_registry")
         
         # Register built-in templates
@@ -432,6 +434,7 @@ class WorkflowTemplateRegistry:
     def register(self, template: WorkflowTemplate):
         """Register a workflow template."""
         self._templates[template.name] = template
+        self._info_cache.pop(template.name, None)
         self.logger.info(f"Registered workflow template: {template.name}")
     
     def get(self, name: str) -> Optional[WorkflowTemplate]:
@@ -443,18 +446,28 @@ class WorkflowTemplateRegistry:
         return list(self._templates.keys())
     
     def get_template_info(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get information about a template."""
+        """
+        Get information about a template.
+        
+        The info is built once per registered template and shared by later
+        calls, so callers must not modify it.
+        """
+        info = self._info_cache.get(name)
+        if info is not None:
+            return info
+        
         template = self.get(name)
         if not template:
             return None
         
-        return {
+        info = self._info_cache[name] = {
             "name": template.name,
             "description": template.description,
             "required_parameters": template.get_required_parameters(),
             "optional_parameters": template.get_optional_parameters(),
             "pattern": self._infer_pattern(template)
         }
+        return info
     
     def _infer_pattern(self, template: WorkflowTemplate) -> str:
         """Infer the workflow pattern from template name."""
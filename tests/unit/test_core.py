@@ -216,6 +216,13 @@ class TestAgentRegistry:
         
         assert agent1 is agent2  # Same instance
     
+    def test_register_does_not_mutate_config(self, test_agent_config):
+        """Test that registering a singleton leaves the caller's config untouched."""
+        registry = AgentRegistry()
+        registry.register("singleton_agent", TestAgent, test_agent_config, singleton=True)
+        
+        assert getattr(test_agent_config, "metadata", None) is None
+    
     def test_registry_info(self, test_agent_config):
         """Test registry information retrieval."""
         registry = AgentRegistry()
@@ -224,6 +231,8 @@ class TestAgentRegistry:
         info = registry.get_registry_info()
         assert info["total_registered"] == 1
         assert "test_agent" in info["agents"]
+        assert info["agents"]["test_agent"]["class"] == "TestAgent"
+        assert info["agents"]["test_agent"]["module"] == TestAgent.__module__
     
     def test_agent_unregistration(self, test_agent_config):
         """Test agent unregistration."""
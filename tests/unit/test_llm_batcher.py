@@ -0,0 +1,145 @@
+"""Unit tests for the SOW LLM micro-batching queue."""
+
+import asyncio
+import gc
+
+import pytest
+from agent_playground.sow.agents import _llm_batcher
+from agent_playground.sow.agents._llm_batcher import AsyncBatchQueue, get_batcher
+
+
+class RecordingProcessor:
+    """Batch function echoing its requests and recording every batch."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, requests):
+        self.batches.append(list(requests))
+        return [ValueError(request) if request == "bad" else request.upper() for request in requests]
+
+
+class FakeChatModel:
+    """Stand-in for a chat model exposing ``abatch``."""
+
+    __hash__ = None  # Chat models are unhashable pydantic models
+
+    async def abatch(self, requests, return_exceptions=False, **kwargs):
+        return list(requests)
+
+
+class TestAsyncBatchQueue:
+    """Test AsyncBatchQueue functionality."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesce(self):
+        """Test that requests queued together are dispatched as one batch."""
+        processor = RecordingProcessor()
+        queue = AsyncBatchQueue(processor, max_batch_size=8, max_wait_time=0.01)
+
+        futures = [await queue.add_request(request) for request in ("a", "b", "c")]
+
+        assert await asyncio.gather(*futures) == ["A", "B", "C"]
+        assert processor.batches == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limit(self):
+        """Test that batches never exceed max_batch_size."""
+        processor = RecordingProcessor()
+        queue = AsyncBatchQueue(processor, max_batch_size=2, max_wait_time=0.01)
+
+        futures = [await queue.add_request(request) for request in ("a", "b", "c")]
+
+        assert await asyncio.gather(*futures) == ["A", "B", "C"]
+        assert processor.batches == [["a", "b"], ["c"]]
+
+    @pytest.mark.asyncio
+    async def test_lone_request_not_delayed(self):
+        """Test that a single request does not wait for the batch window."""
+        processor = RecordingProcessor()
+        queue = AsyncBatchQueue(processor, max_wait_time=60)
+
+        result = await asyncio.wait_for(await queue.add_request("a"), timeout=1)
+
+        assert result == "A"
+
+    @pytest.mark.asyncio
+    async def test_per_request_exception(self):
+        """Test that an exception result fails only its own request."""
+        queue = AsyncBatchQueue(RecordingProcessor(), max_wait_time=0.01)
+
+        good = await queue.add_request("a")
+        bad = await queue.add_request("bad")
+
+        assert await good == "A"
+        with pytest.raises(ValueError):
+            await bad
+
+    @pytest.mark.asyncio
+    async def test_batch_exception(self):
+        """Test that a failing batch call fails every request in it, and later batches still run."""
+        calls = []
+
+        async def process_fn(requests):
+            calls.append(requests)
+            if len(calls) == 1:
+                raise RuntimeError("Test error")
+            return requests
+
+        queue = AsyncBatchQueue(process_fn, max_wait_time=0.01)
+        futures = [await queue.add_request(request) for request in ("a", "b")]
+
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                await future
+        assert await (await queue.add_request("c")) == "c"
+
+    def test_worker_follows_event_loop(self):
+        """Test that the queue keeps working when used from a new event loop."""
+        queue = AsyncBatchQueue(RecordingProcessor(), max_wait_time=0.01)
+
+        async def call(request):
+            return await (await queue.add_request(request))
+
+        assert asyncio.run(call("a")) == "A"
+        assert asyncio.run(call("b")) == "B"
+
+    @pytest.mark.asyncio
+    async def test_worker_exits_when_idle(self):
+        """Test that no worker task lingers once the queue is drained."""
+        queue = AsyncBatchQueue(RecordingProcessor(), max_wait_time=0.01)
+
+        await (await queue.add_request("a"))
+        await asyncio.sleep(0)
+
+        assert queue._worker.done()
+
+
+class TestGetBatcher:
+    """Test the shared batcher lookup."""
+
+    def test_same_model_shares_batcher(self):
+        """Test that a model and keyword arguments map to one batcher."""
+        llm = FakeChatModel()
+
+        assert get_batcher(llm, key="x") is get_batcher(llm, key="x")
+        assert get_batcher(llm, key="x") is not get_batcher(llm, key="y")
+
+    @pytest.mark.asyncio
+    async def test_batcher_dispatches_to_model(self):
+        """Test that the batcher calls the model's abatch."""
+        llm = FakeChatModel()
+
+        assert await (await get_batcher(llm).add_request("a")) == "a"
+
+    def test_batchers_released_with_model(self):
+        """Test that batchers do not keep their model alive."""
+        llm = FakeChatModel()
+        llm_id = id(llm)
+        get_batcher(llm)
+        assert llm_id in _llm_batcher._BATCHERS
+
+        del llm
+        gc.collect()
+
+        assert llm_id not in _llm_batcher._BATCHERS
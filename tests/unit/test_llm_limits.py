@@ -0,0 +1,48 @@
+"""Unit tests for the SOW LLM call limits."""
+
+import asyncio
+
+import pytest
+from agent_playground.sow.llm_limits import env_limit, per_loop_semaphore
+
+
+class TestEnvLimit:
+    """Test reading limits from the environment."""
+
+    def test_default_when_unset(self, monkeypatch):
+        """Test that an unset variable falls back to the default."""
+        monkeypatch.delenv("TEST_LIMIT", raising=False)
+
+        assert env_limit("TEST_LIMIT", 4) == 4
+
+    def test_parses_kind(self, monkeypatch):
+        """Test that a set variable is parsed as the requested type."""
+        monkeypatch.setenv("TEST_LIMIT", "2.5")
+
+        assert env_limit("TEST_LIMIT", 10, float) == 2.5
+
+    @pytest.mark.parametrize("raw", ["abc", "0", "-3", "1.5"])
+    def test_rejects_invalid(self, monkeypatch, raw):
+        """Test that non-numeric and non-positive values name the variable."""
+        monkeypatch.setenv("TEST_LIMIT", raw)
+
+        with pytest.raises(ValueError, match="TEST_LIMIT must be a positive int"):
+            env_limit("TEST_LIMIT", 4)
+
+
+class TestPerLoopSemaphore:
+    """Test semaphores created per event loop."""
+
+    def test_one_semaphore_per_loop(self):
+        """Test that each event loop gets its own semaphore, reused within it."""
+        get_semaphore = per_loop_semaphore(2)
+
+        async def acquire_twice():
+            async with get_semaphore():
+                return get_semaphore(), get_semaphore()
+
+        first, again = asyncio.run(acquire_twice())
+        second, _ = asyncio.run(acquire_twice())
+
+        assert first is again
+        assert first is not second
@@ -0,0 +1,27 @@
+"""Import smoke tests for the lazily loaded SOW package."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("statement", [
+    "from agent_playground.sow import SOWState",
+    "from agent_playground.sow import SOWWorkflow",
+    "from agent_playground.sow import IDVerificationAgent",
+    "from agent_playground.sow import agents",
+    "import agent_playground.sow as sow; sow.IDVerificationAgent",
+])
+def test_sow_import(statement):
+    """Test that each import form works in a fresh interpreter."""
+    result = subprocess.run([sys.executable, "-c", statement], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+def test_sow_unknown_attribute():
+    """Test that unknown names still raise AttributeError."""
+    import agent_playground.sow as sow
+
+    with pytest.raises(AttributeError):
+        getattr(sow, "NoSuchAgent")
@@ -0,0 +1,157 @@
+"""Unit tests for the workflow builder."""
+
+import pytest
+from collections import OrderedDict
+from typing import TypedDict
+from agent_playground.workflows import builder as builder_module
+from agent_playground.workflows.builder import CompiledSequence, WorkflowBuilder
+
+
+class ParallelState(TypedDict, total=False):
+    """State with one channel per key, as parallel steps require."""
+    a: int
+    b: int
+    c: int
+    error: str
+    completed: bool
+
+
+def _increment(state):
+    """Module-level step, so builders over it share a signature."""
+    return {"a": state.get("a", 0) + 1}
+
+
+class TestParallelThenMerge:
+    """Test parallel_then_merge workflows."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_steps_write_disjoint_keys(self):
+        """Test that two branches updating different keys both reach the merge step."""
+        async def set_b(state):
+            state["b"] = 2
+
+        workflow = WorkflowBuilder.parallel_then_merge(
+            [("set_a", lambda state: {"a": 1}), ("set_b", set_b)],
+            ("merge", lambda state: {"c": state["a"] + state["b"]}),
+            state_class=ParallelState,
+            name="test_parallel_disjoint",
+        )
+
+        result = await workflow.ainvoke({"a": 0, "b": 0, "c": 0})
+
+        assert result == {"a": 1, "b": 2, "c": 3}
+
+    @pytest.mark.asyncio
+    async def test_parallel_step_failure(self):
+        """Test that a failing branch reports its error without failing the others."""
+        def fail(state):
+            raise ValueError("Test error")
+
+        workflow = WorkflowBuilder.parallel_then_merge(
+            [("set_a", lambda state: {"a": 1}), ("fail", fail)],
+            ("merge", lambda state: {"c": state["a"]}),
+            state_class=ParallelState,
+            name="test_parallel_failure",
+        )
+
+        result = await workflow.ainvoke({"a": 0})
+
+        assert result["a"] == 1
+        assert result["c"] == 1
+        assert result["error"] == "Test error"
+        assert result["completed"] is False
+
+    @pytest.mark.asyncio
+    async def test_merge_only_is_graph(self):
+        """Test that a workflow without parallel steps is still a compiled graph."""
+        workflow = WorkflowBuilder.parallel_then_merge(
+            [], ("merge", _increment), state_class=ParallelState, name="test_merge_only"
+        )
+
+        assert hasattr(workflow, "get_graph")
+        assert await workflow.ainvoke({"a": 0}) == {"a": 1}
+
+
+class TestCompiledCache:
+    """Test sharing of compiled graphs between builders."""
+
+    def test_same_structure_shares_graph(self):
+        """Test that identical builders reuse one compiled graph."""
+        steps = [("first", _increment), ("second", _increment)]
+
+        first = WorkflowBuilder.sequential(steps, state_class=ParallelState, name="test_shared")
+        second = WorkflowBuilder.sequential(steps, state_class=ParallelState, name="test_shared")
+
+        assert first is second
+
+    def test_debug_setting_splits_cache(self, monkeypatch):
+        """Test that builders with step debug logging on and off do not share a graph."""
+        steps = [("first", _increment), ("second", _increment)]
+
+        monkeypatch.setattr(WorkflowBuilder, "is_enabled_for", lambda self, level: False)
+        quiet = WorkflowBuilder.sequential(steps, state_class=ParallelState, name="test_debug")
+        monkeypatch.setattr(WorkflowBuilder, "is_enabled_for", lambda self, level: True)
+        verbose = WorkflowBuilder.sequential(steps, state_class=ParallelState, name="test_debug")
+
+        assert quiet is not verbose
+
+    def test_cache_is_bounded(self, monkeypatch):
+        """Test that the least recently built graphs are evicted."""
+        monkeypatch.setattr(builder_module, "_COMPILED_CACHE_SIZE", 2)
+        monkeypatch.setattr(WorkflowBuilder, "_compiled_cache", OrderedDict())
+
+        for index in range(3):
+            WorkflowBuilder.sequential(
+                [("first", _increment), ("second", _increment)],
+                state_class=ParallelState,
+                name=f"test_bounded_{index}",
+            )
+
+        assert len(WorkflowBuilder._compiled_cache) == 2
+
+
+class TestSequential:
+    """Test sequential workflows."""
+
+    @pytest.mark.asyncio
+    async def test_single_step_is_graph(self):
+        """Test that a one-step workflow is still a compiled graph."""
+        workflow = WorkflowBuilder.sequential(
+            [("only", _increment)], state_class=ParallelState, name="test_single_step"
+        )
+
+        assert hasattr(workflow, "get_graph")
+        assert await workflow.ainvoke({"a": 0}) == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_fused_opt_in(self):
+        """Test that fused=True runs the steps as one coroutine on a copy of the input."""
+        workflow = WorkflowBuilder.sequential(
+            [("first", _increment), ("second", _increment)],
+            state_class=ParallelState,
+            name="test_fused_opt_in",
+            fused=True,
+        )
+        initial = {"a": 0}
+
+        assert isinstance(workflow, CompiledSequence)
+        assert await workflow.ainvoke(initial) == {"a": 2}
+        assert initial == {"a": 0}
+
+    @pytest.mark.asyncio
+    async def test_fused_invoke_in_running_loop(self):
+        """Test that the synchronous invoke fails clearly inside an event loop."""
+        workflow = WorkflowBuilder.sequential(
+            [("only", _increment)], state_class=ParallelState, name="test_fused_invoke", fused=True
+        )
+
+        with pytest.raises(RuntimeError, match="await ainvoke"):
+            workflow.invoke({"a": 0})
+
+    def test_fused_invoke(self):
+        """Test that the synchronous invoke runs the steps outside an event loop."""
+        workflow = WorkflowBuilder.sequential(
+            [("only", _increment)], state_class=ParallelState, name="test_fused_invoke", fused=True
+        )
+
+        assert workflow.invoke({"a": 0}) == {"a": 1}